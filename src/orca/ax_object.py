@@ -34,32 +34,91 @@ __copyright__ = "Copyright (c) 2023 Igalia, S.L."
 __license__   = "LGPL"
 
 import re
+import string
+import sys
 import threading
 import time
-from typing import Callable, Generator, Optional
+from typing import Any, Callable, Generator, Optional
 
 import gi
 gi.require_version("Atspi", "2.0")
-from gi.repository import Atspi
+from gi.repository import Atspi, GLib
 
 from . import debug
 
+_OBJECT_IS_GONE_RE = re.compile(r"accessible/\d+ does not exist")
+_APP_IS_GONE_RE = re.compile(r"The application no longer exists")
+
+# Used by _normalize_action_name; built once rather than per call. The table
+# maps every ASCII punctuation character to a hyphen.
+_CAMEL_CASE_RE = re.compile(r"(?<=[a-z])([A-Z])")
+_ACTION_PUNCTUATION_TABLE = str.maketrans(string.punctuation, "-" * len(string.punctuation))
+
+# Shared return value for the get_state_set failure paths; callers only read it,
+# so one instance avoids crossing the gi boundary per miss.
+_EMPTY_STATE_SET = Atspi.StateSet()
+
+# Shared return value for the get_attributes_dict failure paths. Callers treat
+# the result as read-only; cache hits already hand out shared dicts.
+_EMPTY_ATTRIBUTES: dict[str, str] = {}
+
 
 class AXObject:
     """Utilities for obtaining information about accessible objects."""
 
+    KNOWN_ACTION_MAPS: dict[int, dict[str, int]] = {}
     KNOWN_DEAD: dict[int, bool] = {}
+    KNOWN_INTERFACES: dict[int, int] = {}
+    KNOWN_N_ACTIONS: dict[int, int] = {}
+    KNOWN_NAMES: dict[int, str] = {}
+    KNOWN_PARENTS: dict[int, Atspi.Accessible] = {}
+    KNOWN_STATES: dict[int, int] = {}
     OBJECT_ATTRIBUTES: dict[int, dict[str, str]] = {}
 
+    # The probes for the interface mask stored in KNOWN_INTERFACES, in bit order.
+    _INTERFACE_GETTERS: tuple = (
+        ("Action", Atspi.Accessible.get_action_iface),
+        ("Collection", Atspi.Accessible.get_collection_iface),
+        ("Component", Atspi.Accessible.get_component_iface),
+        ("Document", Atspi.Accessible.get_document_iface),
+        ("EditableText", Atspi.Accessible.get_editable_text_iface),
+        ("Hyperlink", Atspi.Accessible.get_hyperlink),
+        ("Hypertext", Atspi.Accessible.get_hypertext_iface),
+        ("Image", Atspi.Accessible.get_image_iface),
+        ("Selection", Atspi.Accessible.get_selection_iface),
+        ("Table", Atspi.Accessible.get_table_iface),
+        ("TableCell", Atspi.Accessible.get_table_cell),
+        ("Text", Atspi.Accessible.get_text_iface),
+        ("Value", Atspi.Accessible.get_value_iface),
+    )
+
+    _ACTION_IFACE = 1 << 0
+    _COLLECTION_IFACE = 1 << 1
+    _COMPONENT_IFACE = 1 << 2
+    _DOCUMENT_IFACE = 1 << 3
+    _EDITABLE_TEXT_IFACE = 1 << 4
+    _HYPERLINK_IFACE = 1 << 5
+    _HYPERTEXT_IFACE = 1 << 6
+    _IMAGE_IFACE = 1 << 7
+    _SELECTION_IFACE = 1 << 8
+    _TABLE_IFACE = 1 << 9
+    _TABLE_CELL_IFACE = 1 << 10
+    _TEXT_IFACE = 1 << 11
+    _VALUE_IFACE = 1 << 12
+
+    # Upper bound on each per-object cache so a long-running session cannot grow
+    # them without limit between flushes.
+    _MAX_CACHE_ENTRIES = 4096
+
     _lock = threading.Lock()
 
     @staticmethod
-    def _clear_stored_data() -> None:
-        """Clears any data we have cached for objects"""
+    def _cache_put(cache: dict[int, Any], key: int, value: Any) -> None:
+        """Stores key/value in cache, evicting the oldest entry if the cache is full."""
 
-        while True:
-            time.sleep(60)
-            AXObject._clear_all_dictionaries()
+        if key not in cache and len(cache) >= AXObject._MAX_CACHE_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
 
     @staticmethod
     def _clear_all_dictionaries(reason: str = "") -> None:
@@ -69,7 +128,13 @@ class AXObject:
         debug.print_message(debug.LEVEL_INFO, msg, True)
 
         with AXObject._lock:
+            AXObject.KNOWN_ACTION_MAPS.clear()
             AXObject.KNOWN_DEAD.clear()
+            AXObject.KNOWN_INTERFACES.clear()
+            AXObject.KNOWN_N_ACTIONS.clear()
+            AXObject.KNOWN_NAMES.clear()
+            AXObject.KNOWN_PARENTS.clear()
+            AXObject.KNOWN_STATES.clear()
             AXObject.OBJECT_ATTRIBUTES.clear()
 
     @staticmethod
@@ -78,14 +143,6 @@ class AXObject:
 
         AXObject._clear_all_dictionaries(reason)
 
-    @staticmethod
-    def start_cache_clearing_thread() -> None:
-        """Starts thread to periodically clear cached details."""
-
-        thread = threading.Thread(target=AXObject._clear_stored_data)
-        thread.daemon = True
-        thread.start()
-
     @staticmethod
     def is_bogus(obj: Atspi.Accessible) -> bool:
         """Hack to ignore certain objects. All entries must have a bug."""
@@ -138,7 +195,7 @@ class AXObject:
     def object_is_known_dead(obj: Atspi.Accessible) -> bool:
         """Returns True if we know for certain this object no longer exists"""
 
-        return bool(obj and AXObject.KNOWN_DEAD.get(hash(obj))) is True
+        return obj is not None and AXObject.KNOWN_DEAD.get(hash(obj)) is True
 
     @staticmethod
     def _set_known_dead_status(obj: Atspi.Accessible, is_dead: bool) -> None:
@@ -147,12 +204,20 @@ class AXObject:
         if obj is None:
             return
 
-        current_status = AXObject.KNOWN_DEAD.get(hash(obj))
+        key = hash(obj)
+        current_status = AXObject.KNOWN_DEAD.get(key)
         if current_status == is_dead:
             return
 
-        AXObject.KNOWN_DEAD[hash(obj)] = is_dead
+        AXObject._cache_put(AXObject.KNOWN_DEAD, key, is_dead)
         if is_dead:
+            AXObject.KNOWN_ACTION_MAPS.pop(key, None)
+            AXObject.KNOWN_INTERFACES.pop(key, None)
+            AXObject.KNOWN_N_ACTIONS.pop(key, None)
+            AXObject.KNOWN_NAMES.pop(key, None)
+            AXObject.KNOWN_PARENTS.pop(key, None)
+            AXObject.KNOWN_STATES.pop(key, None)
+            AXObject.OBJECT_ATTRIBUTES.pop(key, None)
             msg = "AXObject: Adding to known dead objects"
             debug.print_message(debug.LEVEL_INFO, msg, True, True)
             return
@@ -163,37 +228,79 @@ class AXObject:
 
     @staticmethod
     def handle_error(obj: Atspi.Accessible, error: Exception, msg: str) -> None:
-        """Parses the exception and potentially updates our status for obj"""
+        """Parses the exception and potentially updates our status for obj.
 
-        error_string = str(error)
-        if re.search(r"accessible/\d+ does not exist", error_string):
-            msg = msg.replace(error_string, "object no longer exists")
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-        elif re.search(r"The application no longer exists", error_string):
-            msg = msg.replace(error_string, "app no longer exists")
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-        else:
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-            return
+        msg names the failed operation; the error details are appended here so
+        callers do not pay for formatting when debug output is disabled."""
 
-        if AXObject.KNOWN_DEAD.get(hash(obj)) is False:
+        error_string = str(error)
+        obj_is_gone = False
+        if _OBJECT_IS_GONE_RE.search(error_string):
+            error_string = "object no longer exists"
+            obj_is_gone = True
+        elif _APP_IS_GONE_RE.search(error_string):
+            error_string = "app no longer exists"
+            obj_is_gone = True
+
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            debug.print_message(debug.LEVEL_INFO, f"{msg}: {error_string}", True)
+
+        if obj_is_gone and AXObject.KNOWN_DEAD.get(hash(obj)) is False:
             AXObject._set_known_dead_status(obj, True)
 
     @staticmethod
-    def supports_action(obj: Atspi.Accessible) -> bool:
-        """Returns True if the action interface is supported on obj"""
+    def _get_interface_mask(obj: Atspi.Accessible) -> int:
+        """Returns the mask of interfaces supported on obj, probing them all once."""
+
+        key = hash(obj)
+        mask = AXObject.KNOWN_INTERFACES.get(key)
+        if mask is not None:
+            return mask
+
+        mask = 0
+        for bit, (name, getter) in enumerate(AXObject._INTERFACE_GETTERS):
+            try:
+                iface = getter(obj)
+            except Exception as error:
+                # Stringifying the wrapper is not free, so only do it if the message
+                # can actually be printed.
+                if debug.debugLevel <= debug.LEVEL_INFO:
+                    msg = f"AXObject: Exception probing {name} interface on {obj}"
+                else:
+                    msg = f"AXObject: Exception probing {name} interface"
+                AXObject.handle_error(obj, error, msg)
+                return mask
+            if iface is not None:
+                mask |= 1 << bit
+
+        AXObject._cache_put(AXObject.KNOWN_INTERFACES, key, mask)
+        return mask
+
+    @staticmethod
+    def get_supported_interfaces(obj: Atspi.Accessible) -> list[str]:
+        """Returns the names of the interfaces supported on obj."""
 
         if not AXObject.is_valid(obj):
-            return False
+            return []
 
-        try:
-            iface = Atspi.Accessible.get_action_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_action_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
+        mask = AXObject._get_interface_mask(obj)
+        return [name for bit, (name, _getter) in enumerate(AXObject._INTERFACE_GETTERS)
+                if mask & (1 << bit)]
+
+    @staticmethod
+    def _supports_interface(obj: Atspi.Accessible, iface_bit: int) -> bool:
+        """Returns True if the interface matching iface_bit is supported on obj."""
+
+        if not AXObject.is_valid(obj):
             return False
 
-        return iface is not None
+        return bool(AXObject._get_interface_mask(obj) & iface_bit)
+
+    @staticmethod
+    def supports_action(obj: Atspi.Accessible) -> bool:
+        """Returns True if the action interface is supported on obj"""
+
+        return AXObject._supports_interface(obj, AXObject._ACTION_IFACE)
 
     @staticmethod
     def supports_collection(obj: Atspi.Accessible) -> bool:
@@ -215,190 +322,73 @@ class AXObject:
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return False
 
-        try:
-            iface = Atspi.Accessible.get_collection_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_collection_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return bool(AXObject._get_interface_mask(obj) & AXObject._COLLECTION_IFACE)
 
     @staticmethod
     def supports_component(obj: Atspi.Accessible) -> bool:
         """Returns True if the component interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_component_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_component_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
-
+        return AXObject._supports_interface(obj, AXObject._COMPONENT_IFACE)
 
     @staticmethod
     def supports_document(obj: Atspi.Accessible) -> bool:
         """Returns True if the document interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_document_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_document_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._DOCUMENT_IFACE)
 
     @staticmethod
     def supports_editable_text(obj: Atspi.Accessible) -> bool:
         """Returns True if the editable-text interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_editable_text_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_editable_text_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._EDITABLE_TEXT_IFACE)
 
     @staticmethod
     def supports_hyperlink(obj: Atspi.Accessible) -> bool:
         """Returns True if the hyperlink interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_hyperlink(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_hyperlink on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._HYPERLINK_IFACE)
 
     @staticmethod
     def supports_hypertext(obj: Atspi.Accessible) -> bool:
         """Returns True if the hypertext interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_hypertext_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_hypertext_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._HYPERTEXT_IFACE)
 
     @staticmethod
     def supports_image(obj: Atspi.Accessible) -> bool:
         """Returns True if the image interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_image_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_image_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._IMAGE_IFACE)
 
     @staticmethod
     def supports_selection(obj: Atspi.Accessible) -> bool:
         """Returns True if the selection interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_selection_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_selection_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._SELECTION_IFACE)
 
     @staticmethod
     def supports_table(obj: Atspi.Accessible) -> bool:
         """Returns True if the table interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_table_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_table_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._TABLE_IFACE)
 
     @staticmethod
     def supports_table_cell(obj: Atspi.Accessible) -> bool:
         """Returns True if the table cell interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_table_cell(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_table_cell on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._TABLE_CELL_IFACE)
 
     @staticmethod
     def supports_text(obj: Atspi.Accessible) -> bool:
         """Returns True if the text interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_text_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_text_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._TEXT_IFACE)
 
     @staticmethod
     def supports_value(obj: Atspi.Accessible) -> bool:
         """Returns True if the value interface is supported on obj"""
 
-        if not AXObject.is_valid(obj):
-            return False
-
-        try:
-            iface = Atspi.Accessible.get_value_iface(obj)
-        except Exception as error:
-            msg = f"AXObject: Exception calling get_value_iface on {obj}: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return False
-
-        return iface is not None
+        return AXObject._supports_interface(obj, AXObject._VALUE_IFACE)
 
     @staticmethod
     def get_path(obj: Atspi.Accessible) -> list[int]:
@@ -413,10 +403,13 @@ class AXObject:
             try:
                 path.append(Atspi.Accessible.get_index_in_parent(acc))
             except Exception as error:
-                msg = f"AXObject: Exception getting index in parent for {acc}: {error}"
+                msg = f"AXObject: Exception getting index in parent for {acc}"
                 AXObject.handle_error(acc, error, msg)
                 return []
-            acc = AXObject.get_parent_checked(acc)
+            # The per-hop tree validation of get_parent_checked is redundant here: a bad
+            # index will show up in the resulting path. Prefer the cached parent so a
+            # depth-D walk costs D index fetches rather than D full verifications.
+            acc = AXObject.KNOWN_PARENTS.get(hash(acc)) or AXObject.get_parent_checked(acc)
 
         path.reverse()
         return path
@@ -431,8 +424,7 @@ class AXObject:
         try:
             index = Atspi.Accessible.get_index_in_parent(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_index_in_parent: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_index_in_parent")
             return -1
 
         return index
@@ -447,11 +439,10 @@ class AXObject:
         try:
             parent = Atspi.Accessible.get_parent(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_parent: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_parent")
             return None
 
-        if parent == obj:
+        if parent is obj or parent == obj:
             tokens = ["AXObject:", obj, "claims to be its own parent"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -470,6 +461,11 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return None
 
+        key = hash(obj)
+        parent = AXObject.KNOWN_PARENTS.get(key)
+        if parent is not None:
+            return parent
+
         role = AXObject.get_role(obj)
         if role in [Atspi.Role.INVALID, Atspi.Role.APPLICATION]:
             return None
@@ -478,7 +474,11 @@ class AXObject:
         if parent is None:
             return None
 
-        if debug.LEVEL_INFO < debug.debugLevel:
+        AXObject._cache_put(AXObject.KNOWN_PARENTS, key, parent)
+
+        # The verification below costs several round trips per hop, so reserve it for
+        # the most verbose debugging; it should never run in production.
+        if debug.LEVEL_ALL < debug.debugLevel:
             return parent
 
         if AXObject.is_dead(obj):
@@ -507,19 +507,22 @@ class AXObject:
             return None
 
         # Keep track of objects we've encountered in order to handle broken trees.
-        objects = [obj]
+        # A set of hashes keeps the containment check O(1); the list-based check was
+        # quadratic in depth and compared wrappers via gi equality.
+        seen = {hash(obj)}
         parent = AXObject.get_parent_checked(obj)
         while parent:
-            if parent in objects:
-                tokens = ["AXObject: Circular tree suspected in find_ancestor. ",
-                          parent, "already in: ", objects]
+            key = hash(parent)
+            if key in seen:
+                tokens = ["AXObject: Circular tree suspected in find_ancestor.",
+                          parent, "already encountered walking up from", obj]
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 return None
 
             if pred(parent):
                 return parent
 
-            objects.append(parent)
+            seen.add(key)
             parent = AXObject.get_parent_checked(parent)
 
         return None
@@ -534,7 +537,21 @@ class AXObject:
         if not AXObject.is_valid(ancestor):
             return False
 
-        return AXObject.find_ancestor(obj, lambda x: x == ancestor) is not None
+        # This walk is specialized for the equality check rather than deferring to
+        # find_ancestor with a predicate; is_ancestor is too hot for the closure
+        # call and candidate-list bookkeeping done there.
+        seen = {hash(obj)}
+        parent = AXObject.get_parent_checked(obj)
+        while parent is not None:
+            if parent is ancestor or parent == ancestor:
+                return True
+            key = hash(parent)
+            if key in seen:
+                return False
+            seen.add(key)
+            parent = AXObject.get_parent_checked(parent)
+
+        return False
 
     @staticmethod
     def get_child(obj: Atspi.Accessible, index: int) -> Optional[Atspi.Accessible]:
@@ -556,11 +573,10 @@ class AXObject:
         try:
             child = Atspi.Accessible.get_child_at_index(obj, index)
         except Exception as error:
-            msg = f"AXObject: Exception in get_child: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_child")
             return None
 
-        if child == obj:
+        if child is obj or child == obj:
             tokens = ["AXObject:", obj, "claims to be its own child"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -581,7 +597,7 @@ class AXObject:
             return child
 
         parent = AXObject.get_parent(child)
-        if obj != parent:
+        if obj is not parent and obj != parent:
             tokens = ["AXObject:", obj, "claims", child, "as child; child's parent is", parent]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
@@ -601,11 +617,11 @@ class AXObject:
         try:
             real_child = Atspi.Accessible.get_child_at_index(container, index)
         except Exception as error:
-            msg = f"AXObject: Exception in get_active_descendant_checked: {error}"
-            AXObject.handle_error(container, error, msg)
+            AXObject.handle_error(
+                container, error, "AXObject: Exception in get_active_descendant_checked")
             return reported_child
 
-        if real_child != reported_child:
+        if real_child is not reported_child and real_child != reported_child:
             tokens = [
                 "AXObject: ", container, f"'s child at {index} is ", real_child,
                 "; not reported child", reported_child
@@ -624,15 +640,22 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return None
 
-        for i in range(AXObject.get_child_count(obj)):
-            child = AXObject.get_child_checked(obj, i)
-            if child is None:
+        # An explicit stack avoids blowing the recursion limit on deep trees, and the
+        # seen set protects us against cycles in broken ones.
+        stack = [obj]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            key = hash(node)
+            if key in seen:
                 continue
-            if pred(child):
-                return child
-            child = AXObject._find_descendant(child, pred)
-            if child:
-                return child
+            seen.add(key)
+            if node is not obj and pred(node):
+                return node
+            for i in range(AXObject.get_child_count(node) - 1, -1, -1):
+                child = AXObject.get_child_checked(node, i)
+                if child is not None:
+                    stack.append(child)
 
         return None
 
@@ -711,8 +734,7 @@ class AXObject:
         try:
             role = Atspi.Accessible.get_role(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_role: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_role")
             return Atspi.Role.INVALID
 
         AXObject._set_known_dead_status(obj, False)
@@ -731,8 +753,7 @@ class AXObject:
             else:
                 role_name = Atspi.Accessible.get_localized_role_name(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_role_name: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_role_name")
             return ""
 
         return role_name
@@ -747,8 +768,7 @@ class AXObject:
         try:
             result = Atspi.Accessible.get_accessible_id(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_accessible_id: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_accessible_id")
             return ""
 
         AXObject._set_known_dead_status(obj, False)
@@ -761,14 +781,19 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return ""
 
+        key = hash(obj)
+        name = AXObject.KNOWN_NAMES.get(key)
+        if name is not None:
+            return name
+
         try:
             name = Atspi.Accessible.get_name(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_name: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_name")
             return ""
 
         AXObject._set_known_dead_status(obj, False)
+        AXObject._cache_put(AXObject.KNOWN_NAMES, key, name)
         return name
 
     @staticmethod
@@ -791,8 +816,7 @@ class AXObject:
         try:
             description = Atspi.Accessible.get_description(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_description: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_description")
             return ""
 
         return description
@@ -807,8 +831,7 @@ class AXObject:
         try:
             description = Atspi.Image.get_image_description(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_image_description: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_image_description")
             return ""
 
         return description
@@ -823,8 +846,7 @@ class AXObject:
         try:
             result = Atspi.Image.get_image_size(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_image_size: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_image_size")
             return 0, 0
 
         # The return value is an AtspiPoint, hence x and y.
@@ -856,8 +878,7 @@ class AXObject:
         try:
             count = Atspi.Accessible.get_child_count(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_child_count: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_child_count")
             return 0
 
         return count
@@ -878,9 +899,17 @@ class AXObject:
             tokens = ["AXObject:", obj, "has more than 500 children"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True, True)
 
+        # Fetch each child directly rather than via get_child, which would re-fetch
+        # and re-check the child count on every single call.
         for index in range(child_count):
-            child = AXObject.get_child(obj, index)
-            if child is not None and (pred is None or pred(child)):
+            try:
+                child = Atspi.Accessible.get_child_at_index(obj, index)
+            except Exception as error:
+                AXObject.handle_error(obj, error, "AXObject: Exception in iter_children")
+                return
+            if child is None or child is obj:
+                continue
+            if pred is None or pred(child):
                 yield child
 
     @staticmethod
@@ -899,7 +928,7 @@ class AXObject:
             return None
 
         sibling = AXObject.get_child(parent, index - 1)
-        if sibling == obj:
+        if sibling is obj or sibling == obj:
             tokens = ["AXObject:", obj, "claims to be its own sibling"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -922,7 +951,7 @@ class AXObject:
             return None
 
         sibling = AXObject.get_child(parent, index + 1)
-        if sibling == obj:
+        if sibling is obj or sibling == obj:
             tokens = ["AXObject:", obj, "claims to be its own sibling"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -938,16 +967,19 @@ class AXObject:
 
         index = AXObject.get_index_in_parent(obj) + 1
         parent = AXObject.get_parent(obj)
-        while parent and not 0 < index < AXObject.get_child_count(parent):
+        # Fetch the count once per parent; it cannot change mid-climb.
+        n_children = AXObject.get_child_count(parent)
+        while parent and not 0 < index < n_children:
             obj = parent
             index = AXObject.get_index_in_parent(obj) + 1
             parent = AXObject.get_parent(obj)
+            n_children = AXObject.get_child_count(parent)
 
         if parent is None:
             return None
 
         next_object = AXObject.get_child(parent, index)
-        if next_object == obj:
+        if next_object is obj or next_object == obj:
             tokens = ["AXObject:", obj, "claims to be its own next object"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -963,16 +995,19 @@ class AXObject:
 
         index = AXObject.get_index_in_parent(obj) - 1
         parent = AXObject.get_parent(obj)
-        while parent and not 0 <= index < AXObject.get_child_count(parent) - 1:
+        # Fetch the count once per parent; it cannot change mid-climb.
+        n_children = AXObject.get_child_count(parent)
+        while parent and not 0 <= index < n_children - 1:
             obj = parent
             index = AXObject.get_index_in_parent(obj) - 1
             parent = AXObject.get_parent(obj)
+            n_children = AXObject.get_child_count(parent)
 
         if parent is None:
             return None
 
         previous_object = AXObject.get_child(parent, index)
-        if previous_object == obj:
+        if previous_object is obj or previous_object == obj:
             tokens = ["AXObject:", obj, "claims to be its own previous object"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
@@ -984,18 +1019,73 @@ class AXObject:
         """Returns the state set associated with obj"""
 
         if not AXObject.is_valid(obj):
-            return Atspi.StateSet()
+            return _EMPTY_STATE_SET
 
         try:
             state_set = Atspi.Accessible.get_state_set(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_state_set: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return Atspi.StateSet()
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_state_set")
+            return _EMPTY_STATE_SET
 
         AXObject._set_known_dead_status(obj, False)
         return state_set
 
+    @staticmethod
+    def _get_state_mask(obj: Atspi.Accessible) -> int:
+        """Returns the mask of states in obj's state set, fetching the set once."""
+
+        key = hash(obj)
+        mask = AXObject.KNOWN_STATES.get(key)
+        if mask is not None:
+            return mask
+
+        mask = 0
+        state_set = AXObject.get_state_set(obj)
+        for state in state_set.get_states():
+            mask |= 1 << int(state)
+
+        # get_state_set hands back the shared empty set when the fetch fails;
+        # caching that would pin a transient failure as "has no states".
+        if state_set is not _EMPTY_STATE_SET:
+            AXObject._cache_put(AXObject.KNOWN_STATES, key, mask)
+        return mask
+
+    @staticmethod
+    def clear_stored_name(obj: Atspi.Accessible) -> None:
+        """Discards the cached name of obj, e.g. due to a name-change event."""
+
+        if obj is None:
+            return
+
+        AXObject.KNOWN_NAMES.pop(hash(obj), None)
+
+    @staticmethod
+    def clear_stored_states(obj: Atspi.Accessible) -> None:
+        """Discards the cached state mask of obj, e.g. due to a state-changed event."""
+
+        if obj is None:
+            return
+
+        AXObject.KNOWN_STATES.pop(hash(obj), None)
+
+    @staticmethod
+    def clear_stored_attributes(obj: Atspi.Accessible) -> None:
+        """Discards the cached attributes of obj, e.g. due to an attributes-changed event."""
+
+        if obj is None:
+            return
+
+        AXObject.OBJECT_ATTRIBUTES.pop(hash(obj), None)
+
+    @staticmethod
+    def clear_stored_parent(obj: Atspi.Accessible) -> None:
+        """Discards the cached parent of obj, e.g. due to a children-changed event."""
+
+        if obj is None:
+            return
+
+        AXObject.KNOWN_PARENTS.pop(hash(obj), None)
+
     @staticmethod
     def has_state(obj: Atspi.Accessible, state: Atspi.StateType) -> bool:
         """Returns true if obj has the specified state"""
@@ -1003,7 +1093,7 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return False
 
-        return AXObject.get_state_set(obj).contains(state)
+        return bool((AXObject._get_state_mask(obj) >> int(state)) & 1)
 
     @staticmethod
     def clear_cache(
@@ -1016,6 +1106,8 @@ class AXObject:
         if obj is None:
             return
 
+        AXObject.clear_stored_name(obj)
+        AXObject.clear_stored_states(obj)
         tokens = ["AXObject: Clearing AT-SPI cache on", obj, f"Recursive: {recursive}."]
         if reason:
             tokens.append(f" Reason: {reason}")
@@ -1032,8 +1124,7 @@ class AXObject:
         try:
             Atspi.Accessible.clear_cache(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in clear_cache: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in clear_cache")
 
     @staticmethod
     def get_process_id(obj: Atspi.Accessible) -> int:
@@ -1045,8 +1136,7 @@ class AXObject:
         try:
             pid = Atspi.Accessible.get_process_id(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_process_id: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_process_id")
             return -1
 
         return pid
@@ -1063,11 +1153,11 @@ class AXObject:
 
         try:
             # We use the Atspi function rather than the AXObject function because the
-            # latter intentionally handles exceptions.
+            # latter intentionally handles exceptions. A dead proxy raises GLib.Error;
+            # catching that specifically keeps the matching cost on this hot path low.
             Atspi.Accessible.get_name(obj)
-        except Exception as error:
-            msg = f"AXObject: Accessible is dead: {error}"
-            AXObject.handle_error(obj, error, msg)
+        except GLib.Error as error:
+            AXObject.handle_error(obj, error, "AXObject: Accessible is dead")
             return True
 
         AXObject._set_known_dead_status(obj, False)
@@ -1081,24 +1171,24 @@ class AXObject:
         """Returns the object attributes of obj as a dictionary."""
 
         if not AXObject.is_valid(obj):
-            return {}
+            return _EMPTY_ATTRIBUTES
 
+        key = hash(obj)
         if use_cache:
-            attributes = AXObject.OBJECT_ATTRIBUTES.get(hash(obj))
+            attributes = AXObject.OBJECT_ATTRIBUTES.get(key)
             if attributes:
                 return attributes
 
         try:
             attributes = Atspi.Accessible.get_attributes(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_attributes_dict: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return {}
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_attributes_dict")
+            return _EMPTY_ATTRIBUTES
 
         if attributes is None:
-            return {}
+            return _EMPTY_ATTRIBUTES
 
-        AXObject.OBJECT_ATTRIBUTES[hash(obj)] = attributes
+        AXObject._cache_put(AXObject.OBJECT_ATTRIBUTES, key, attributes)
         return attributes
 
     @staticmethod
@@ -1109,11 +1199,7 @@ class AXObject:
     ) -> str:
         """Returns the value of the specified attribute as a string."""
 
-        if not AXObject.is_valid(obj):
-            return ""
-
-        attributes = AXObject.get_attributes_dict(obj, use_cache)
-        return attributes.get(attribute_name, "")
+        return AXObject.get_attributes_dict(obj, use_cache).get(attribute_name, "")
 
     @staticmethod
     def get_n_actions(obj: Atspi.Accessible) -> int:
@@ -1122,15 +1208,24 @@ class AXObject:
         if not AXObject.supports_action(obj):
             return 0
 
+        key = hash(obj)
+        count = AXObject.KNOWN_N_ACTIONS.get(key)
+        if count is not None:
+            return count
+
         try:
             count = Atspi.Action.get_n_actions(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in get_n_actions: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_n_actions")
             return 0
 
+        AXObject._cache_put(AXObject.KNOWN_N_ACTIONS, key, count)
         return count
 
+    # Action names come from a small set of implementor-provided strings, so the
+    # normalizations are memoized to avoid re-running the substitutions.
+    _NORMALIZED_ACTION_NAMES: dict[str, str] = {}
+
     @staticmethod
     def _normalize_action_name(action_name: str) -> str:
         """Adjusts the name to account for differences in implementations."""
@@ -1138,36 +1233,41 @@ class AXObject:
         if not action_name:
             return ""
 
-        name = re.sub(r'(?<=[a-z])([A-Z])', r'-\1', action_name).lower()
-        name = re.sub('[!\"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~]', '-', name)
+        name = AXObject._NORMALIZED_ACTION_NAMES.get(action_name)
+        if name is None:
+            name = _CAMEL_CASE_RE.sub(r'-\1', action_name).lower()
+            # Interning lets the dict lookups in the action maps compare the
+            # small set of recurring names by pointer rather than by content.
+            name = sys.intern(name.translate(_ACTION_PUNCTUATION_TABLE))
+            AXObject._NORMALIZED_ACTION_NAMES[action_name] = name
         return name
 
     @staticmethod
-    def get_action_name(obj: Atspi.Accessible, i: int) -> str:
-        """Returns the name of obj's action at index i."""
-
-        if not 0 <= i < AXObject.get_n_actions(obj):
-            return ""
+    def _get_action_name_unchecked(obj: Atspi.Accessible, i: int) -> str:
+        """Returns the name of obj's action at index i. The caller checks bounds."""
 
         try:
             name = Atspi.Action.get_action_name(obj, i)
         except Exception as error:
-            msg = f"AXObject: Exception in get_action_name: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_action_name")
             return ""
 
         return AXObject._normalize_action_name(name)
 
+    @staticmethod
+    def get_action_name(obj: Atspi.Accessible, i: int) -> str:
+        """Returns the name of obj's action at index i."""
+
+        if not 0 <= i < AXObject.get_n_actions(obj):
+            return ""
+
+        return AXObject._get_action_name_unchecked(obj, i)
+
     @staticmethod
     def get_action_names(obj: Atspi.Accessible) -> list[str]:
         """Returns the list of actions supported on obj."""
 
-        results = []
-        for i in range(AXObject.get_n_actions(obj)):
-            name = AXObject.get_action_name(obj, i)
-            if name:
-                results.append(name)
-        return results
+        return list(AXObject._get_action_map(obj))
 
     @staticmethod
     def get_action_description(obj: Atspi.Accessible, i: int) -> str:
@@ -1179,8 +1279,7 @@ class AXObject:
         try:
             description = Atspi.Action.get_action_description(obj, i)
         except Exception as error:
-            msg = f"AXObject: Exception in get_action_description: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_action_description")
             return ""
 
         return description
@@ -1195,8 +1294,7 @@ class AXObject:
         try:
             keybinding = Atspi.Action.get_key_binding(obj, i)
         except Exception as error:
-            msg = f"AXObject: Exception in get_action_key_binding: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in get_action_key_binding")
             return ""
 
         # GTK4 does this.
@@ -1210,16 +1308,31 @@ class AXObject:
 
         return AXObject.get_action_index(obj, action_name) >= 0
 
+    @staticmethod
+    def _get_action_map(obj: Atspi.Accessible) -> dict[str, int]:
+        """Returns a map from normalized action name to index for obj."""
+
+        key = hash(obj)
+        action_map = AXObject.KNOWN_ACTION_MAPS.get(key)
+        if action_map is not None:
+            return action_map
+
+        action_map = {}
+        get_name = AXObject._get_action_name_unchecked
+        for i in range(AXObject.get_n_actions(obj)):
+            name = get_name(obj, i)
+            if name and name not in action_map:
+                action_map[name] = i
+
+        AXObject._cache_put(AXObject.KNOWN_ACTION_MAPS, key, action_map)
+        return action_map
+
     @staticmethod
     def get_action_index(obj: Atspi.Accessible, action_name: str) -> int:
         """Returns the index of the named action or -1 if unsupported."""
 
         action_name = AXObject._normalize_action_name(action_name)
-        for i in range(AXObject.get_n_actions(obj)):
-            if action_name == AXObject.get_action_name(obj, i):
-                return i
-
-        return -1
+        return AXObject._get_action_map(obj).get(action_name, -1)
 
     @staticmethod
     def do_action(obj: Atspi.Accessible, i: int) -> bool:
@@ -1233,8 +1346,7 @@ class AXObject:
         try:
             result = Atspi.Action.do_action(obj, i)
         except Exception as error:
-            msg = f"AXObject: Exception in do_action: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in do_action")
             return False
 
         return result
@@ -1251,7 +1363,15 @@ class AXObject:
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return False
 
-        return AXObject.do_action(obj, index)
+        # The index came from the action map, so the bounds re-check in
+        # do_action would be redundant.
+        try:
+            result = Atspi.Action.do_action(obj, index)
+        except Exception as error:
+            AXObject.handle_error(obj, error, "AXObject: Exception in do_named_action")
+            return False
+
+        return result
 
     @staticmethod
     def grab_focus(obj: Atspi.Accessible) -> bool:
@@ -1263,8 +1383,7 @@ class AXObject:
         try:
             result = Atspi.Component.grab_focus(obj)
         except Exception as error:
-            msg = f"AXObject: Exception in grab_focus: {error}"
-            AXObject.handle_error(obj, error, msg)
+            AXObject.handle_error(obj, error, "AXObject: Exception in grab_focus")
             return False
 
         if debug.LEVEL_INFO < debug.debugLevel:
@@ -1275,5 +1394,3 @@ class AXObject:
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
         return result
-
-AXObject.start_cache_clearing_thread()
@@ -44,6 +44,21 @@ from .ax_object import AXObject
 class AXUtilitiesApplication:
     """Utilities for obtaining information about accessible applications."""
 
+    # An application's toolkit never changes over its lifetime, so the answer
+    # from AT-SPI is cached here to avoid a round trip per call.
+    TOOLKIT_NAMES: dict[int, str] = {}
+
+    @staticmethod
+    def clear_cache_now(reason: str = "") -> None:
+        """Clears all cached information immediately."""
+
+        msg = "AXUtilitiesApplication: Clearing cache."
+        if reason:
+            msg += f" Reason: {reason}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+
+        AXUtilitiesApplication.TOOLKIT_NAMES.clear()
+
     @staticmethod
     def application_as_string(obj: Atspi.Accessible) -> str:
         """Returns the application details of obj as a string."""
@@ -105,6 +120,11 @@ class AXUtilitiesApplication:
         if app is None:
             return ""
 
+        key = hash(app)
+        name = AXUtilitiesApplication.TOOLKIT_NAMES.get(key)
+        if name is not None:
+            return name
+
         try:
             name = Atspi.Accessible.get_toolkit_name(app)
         except Exception as error:
@@ -112,6 +132,7 @@ class AXUtilitiesApplication:
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return ""
 
+        AXUtilitiesApplication.TOOLKIT_NAMES[key] = name
         return name
 
     @staticmethod
@@ -52,6 +52,27 @@ from .ax_utilities_relation import AXUtilitiesRelation
 class AXUtilitiesDebugging:
     """Utilities for obtaining accessibility information for debugging."""
 
+    # The value_name transformations below are constant per enum value, so the
+    # results are memoized rather than recomputed on every call.
+    _STATE_NAMES: dict[Atspi.StateType, str] = {}
+    _RELATION_NAMES: dict[Atspi.RelationType, str] = {}
+
+    @staticmethod
+    def _state_name(state: Atspi.StateType) -> str:
+        name = AXUtilitiesDebugging._STATE_NAMES.get(state)
+        if name is None:
+            name = state.value_name[12:].replace("_", "-").lower()
+            AXUtilitiesDebugging._STATE_NAMES[state] = name
+        return name
+
+    @staticmethod
+    def _relation_name(relation_type: Atspi.RelationType) -> str:
+        name = AXUtilitiesDebugging._RELATION_NAMES.get(relation_type)
+        if name is None:
+            name = relation_type.value_name[15:].replace("_", "-").lower()
+            AXUtilitiesDebugging._RELATION_NAMES[relation_type] = name
+        return name
+
     @staticmethod
     def _format_string(string: str = "") -> str:
         string = string.replace("\n", "\\n").replace("\ufffc", "[OBJ]")
@@ -124,13 +145,20 @@ class AXUtilitiesDebugging:
     def actions_as_string(obj: Atspi.Accessible) -> str:
         """Returns information about the actions as a string."""
 
-        results = []
-        for i in range(AXObject.get_n_actions(obj)):
-            result = AXObject.get_action_name(obj, i)
-            keybinding = AXObject.get_action_key_binding(obj, i)
+        n_actions = AXObject.get_n_actions(obj)
+        if not n_actions:
+            return ""
+
+        get_name = AXObject.get_action_name
+        get_key_binding = AXObject.get_action_key_binding
+        results: list[str] = []
+        append = results.append
+        for i in range(n_actions):
+            result = get_name(obj, i)
+            keybinding = get_key_binding(obj, i)
             if keybinding:
                 result += f" ({keybinding})"
-            results.append(result)
+            append(result)
 
         return "; ".join(results)
 
@@ -138,36 +166,24 @@ class AXUtilitiesDebugging:
     def attributes_as_string(obj: Atspi.Accessible) -> str:
         """Returns the object attributes of obj as a string."""
 
-        def as_string(attribute):
-            return f"{attribute[0]}:{attribute[1]}"
-
-        return ", ".join(map(as_string, AXObject.get_attributes_dict(obj).items()))
+        return ", ".join(
+            f"{key}:{value}" for key, value in AXObject.get_attributes_dict(obj).items())
 
     @staticmethod
     def interfaces_as_string(obj: Atspi.Accessible) -> str:
         """Returns the supported interfaces of obj as a string."""
 
-        if not AXObject.is_valid(obj):
-            return ""
+        return ", ".join(AXObject.get_supported_interfaces(obj))
 
-        iface_checks = [
-            (AXObject.supports_action, "Action"),
-            (AXObject.supports_collection, "Collection"),
-            (AXObject.supports_component, "Component"),
-            (AXObject.supports_document, "Document"),
-            (AXObject.supports_editable_text, "EditableText"),
-            (AXObject.supports_hyperlink, "Hyperlink"),
-            (AXObject.supports_hypertext, "Hypertext"),
-            (AXObject.supports_image, "Image"),
-            (AXObject.supports_selection, "Selection"),
-            (AXObject.supports_table, "Table"),
-            (AXObject.supports_table_cell, "TableCell"),
-            (AXObject.supports_text, "Text"),
-            (AXObject.supports_value, "Value"),
-        ]
-
-        ifaces = [iface for check, iface in iface_checks if check(obj)]
-        return ", ".join(ifaces)
+    @staticmethod
+    def _relation_target_as_string(acc: Atspi.Accessible) -> str:
+        result = AXObject.get_role_name(acc)
+        name = AXObject.get_name(acc)
+        if name:
+            result += f": '{name}'"
+        if not result:
+            result = "DEAD"
+        return f"[{result}]"
 
     @staticmethod
     def relations_as_string(obj: Atspi.Accessible) -> str:
@@ -176,24 +192,13 @@ class AXUtilitiesDebugging:
         if not AXObject.is_valid(obj):
             return ""
 
-        def as_string(relations):
-            return relations.value_name[15:].replace("_", "-").lower()
-
-        def obj_as_string(acc):
-            result = AXObject.get_role_name(acc)
-            name = AXObject.get_name(acc)
-            if name:
-                result += f": '{name}'"
-            if not result:
-                result = "DEAD"
-            return f"[{result}]"
-
         results = []
         for rel in AXUtilitiesRelation.get_relations(obj):
-            type_string = as_string(rel.get_relation_type())
+            type_string = AXUtilitiesDebugging._relation_name(rel.get_relation_type())
             targets = AXUtilitiesRelation.get_relation_targets_for_debugging(
                 obj, rel.get_relation_type())
-            target_string = ",".join(map(obj_as_string, targets))
+            target_string = ",".join(
+                map(AXUtilitiesDebugging._relation_target_as_string, targets))
             results.append(f"{type_string}: {target_string}")
 
         return "; ".join(results)
@@ -205,10 +210,8 @@ class AXUtilitiesDebugging:
         if not AXObject.is_valid(obj):
             return ""
 
-        def as_string(state):
-            return state.value_name[12:].replace("_", "-").lower()
-
-        return ", ".join(map(as_string, AXObject.get_state_set(obj).get_states()))
+        return ", ".join(
+            map(AXUtilitiesDebugging._state_name, AXObject.get_state_set(obj).get_states()))
 
     @staticmethod
     def text_for_debugging(obj: Atspi.Accessible) -> str:
@@ -36,7 +36,7 @@ __license__   = "LGPL"
 
 import enum
 import threading
-import time
+from typing import Optional
 
 import gi
 gi.require_version("Atspi", "2.0")
@@ -98,28 +98,95 @@ class TextEventReason(enum.Enum):
     UNSPECIFIED_SELECTION = enum.auto()
 
 
+class _LastKnown:
+    """The last-known properties and states of an object, saved for event processing."""
+
+    __slots__ = ("name", "description", "checked", "expanded", "indeterminate",
+                 "pressed", "selected")
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.description: Optional[str] = None
+        self.checked: Optional[bool] = None
+        self.expanded: Optional[bool] = None
+        self.indeterminate: Optional[bool] = None
+        self.pressed: Optional[bool] = None
+        self.selected: Optional[bool] = None
+
+
+# The text-ui role list never changes, so snapshot it once for the O(1)
+# membership tests in the deletion and insertion classifiers.
+_TEXT_UI_ROLES = frozenset(AXUtilitiesRole.get_text_ui_roles())
+
+# Ordered (input-event-manager predicate name, reason) pairs shared by the
+# caret-moved and selection-changed classifiers below.
+_SELECTION_NAV_PAIRS = (
+    ("last_event_was_line_navigation", TextEventReason.SELECTION_BY_LINE),
+    ("last_event_was_word_navigation", TextEventReason.SELECTION_BY_WORD),
+    ("last_event_was_character_navigation", TextEventReason.SELECTION_BY_CHARACTER),
+    ("last_event_was_page_navigation", TextEventReason.SELECTION_BY_PAGE),
+    ("last_event_was_line_boundary_navigation", TextEventReason.SELECTION_TO_LINE_BOUNDARY),
+    ("last_event_was_file_boundary_navigation", TextEventReason.SELECTION_TO_FILE_BOUNDARY),
+)
+
+_CARET_NAV_PAIRS = (
+    ("last_event_was_line_navigation", TextEventReason.NAVIGATION_BY_LINE),
+    ("last_event_was_word_navigation", TextEventReason.NAVIGATION_BY_WORD),
+    ("last_event_was_character_navigation", TextEventReason.NAVIGATION_BY_CHARACTER),
+    ("last_event_was_page_navigation", TextEventReason.NAVIGATION_BY_PAGE),
+    ("last_event_was_line_boundary_navigation", TextEventReason.NAVIGATION_TO_LINE_BOUNDARY),
+    ("last_event_was_file_boundary_navigation", TextEventReason.NAVIGATION_TO_FILE_BOUNDARY),
+)
+
+
+# Ordered pairs for the branch handling keystrokes in editable text, shared by
+# the classifiers below. The insertion classifier keeps its own chain because
+# undo, redo, and typing interact with selected-text restoration there.
+_EDITABLE_ACTION_PAIRS = (
+    ("last_event_was_backspace", TextEventReason.BACKSPACE),
+    ("last_event_was_delete", TextEventReason.DELETE),
+    ("last_event_was_cut", TextEventReason.CUT),
+    ("last_event_was_paste", TextEventReason.PASTE),
+    ("last_event_was_undo", TextEventReason.UNDO),
+    ("last_event_was_redo", TextEventReason.REDO),
+)
+
+_CARET_EDITABLE_PAIRS = _EDITABLE_ACTION_PAIRS + (
+    ("last_event_was_page_switch", TextEventReason.PAGE_SWITCH),
+    ("last_event_was_command", TextEventReason.UNSPECIFIED_COMMAND),
+    ("last_event_was_printable_key", TextEventReason.TYPING),
+)
+
+_TEXT_CHANGE_EDITABLE_PAIRS = _EDITABLE_ACTION_PAIRS + (
+    ("last_event_was_command", TextEventReason.UNSPECIFIED_COMMAND),
+    ("last_event_was_printable_key", TextEventReason.TYPING),
+)
+
+
 class AXUtilitiesEvent:
     """Utilities for obtaining event-related information."""
 
-    LAST_KNOWN_DESCRIPTION: dict[int, str] = {}
-    LAST_KNOWN_NAME: dict[int, str] = {}
-
-    LAST_KNOWN_CHECKED: dict[int, bool] = {}
-    LAST_KNOWN_EXPANDED: dict[int, bool] = {}
-    LAST_KNOWN_INDETERMINATE: dict[int, bool] = {}
-    LAST_KNOWN_PRESSED: dict[int, bool] = {}
-    LAST_KNOWN_SELECTED: dict[int, bool] = {}
+    # One record per object rather than parallel dicts so a save or check costs
+    # a single hashtable probe for all of the related fields.
+    LAST_KNOWN: dict[int, _LastKnown] = {}
 
+    # Keyed by the event itself: gi wrappers hash by identity, so this is as
+    # cheap as an id() key while the strong reference rules out id reuse. The
+    # bound keeps the memo from pinning more than the most recent events
+    # between the periodic sweeps.
     TEXT_EVENT_REASON: dict[Atspi.Event, TextEventReason] = {}
+    _MAX_REASON_ENTRIES = 256
 
     _lock = threading.Lock()
+    _stop_cache_clearing = threading.Event()
+    _cache_clearing_thread_started = False
+    _last_window_key: Optional[int] = None
 
     @staticmethod
     def _clear_stored_data() -> None:
         """Clears any data we have cached for objects"""
 
-        while True:
-            time.sleep(60)
+        while not AXUtilitiesEvent._stop_cache_clearing.wait(60):
             AXUtilitiesEvent._clear_all_dictionaries()
 
     @staticmethod
@@ -128,14 +195,9 @@ class AXUtilitiesEvent:
         if reason:
             msg += f" Reason: {reason}"
         debug.print_message(debug.LEVEL_INFO, msg, True)
-        AXUtilitiesEvent.LAST_KNOWN_DESCRIPTION.clear()
-        AXUtilitiesEvent.LAST_KNOWN_NAME.clear()
-        AXUtilitiesEvent.LAST_KNOWN_CHECKED.clear()
-        AXUtilitiesEvent.LAST_KNOWN_EXPANDED.clear()
-        AXUtilitiesEvent.LAST_KNOWN_INDETERMINATE.clear()
-        AXUtilitiesEvent.LAST_KNOWN_PRESSED.clear()
-        AXUtilitiesEvent.LAST_KNOWN_SELECTED.clear()
+        AXUtilitiesEvent.LAST_KNOWN.clear()
         AXUtilitiesEvent.TEXT_EVENT_REASON.clear()
+        AXUtilitiesEvent._last_window_key = None
 
     @staticmethod
     def clear_cache_now(reason: str = "") -> None:
@@ -143,6 +205,24 @@ class AXUtilitiesEvent:
 
         AXUtilitiesEvent._clear_all_dictionaries(reason)
 
+    @staticmethod
+    def _get_last_known(key: int) -> _LastKnown:
+        """Returns the last-known record for key, creating it if necessary."""
+
+        info = AXUtilitiesEvent.LAST_KNOWN.get(key)
+        if info is None:
+            info = _LastKnown()
+            AXUtilitiesEvent.LAST_KNOWN[key] = info
+        return info
+
+    @staticmethod
+    def _update_and_changed(info: _LastKnown, field: str, new_value) -> bool:
+        """Stores new_value in info's field, returning True if it differs from the old value."""
+
+        old_value = getattr(info, field)
+        setattr(info, field, new_value)
+        return old_value != new_value
+
     @staticmethod
     def save_object_info_for_events(obj: Atspi.Accessible) -> None:
         """Saves properties, states, etc. of obj for later use in event processing."""
@@ -150,32 +230,55 @@ class AXUtilitiesEvent:
         if obj is None:
             return
 
-        AXUtilitiesEvent.LAST_KNOWN_DESCRIPTION[hash(obj)] = AXObject.get_description(obj)
-        AXUtilitiesEvent.LAST_KNOWN_NAME[hash(obj)] = AXObject.get_name(obj)
-        AXUtilitiesEvent.LAST_KNOWN_CHECKED[hash(obj)] = AXUtilitiesState.is_checked(obj)
-        AXUtilitiesEvent.LAST_KNOWN_EXPANDED[hash(obj)] = AXUtilitiesState.is_expanded(obj)
-        AXUtilitiesEvent.LAST_KNOWN_INDETERMINATE[hash(obj)] = \
-            AXUtilitiesState.is_indeterminate(obj)
-        AXUtilitiesEvent.LAST_KNOWN_PRESSED[hash(obj)] = AXUtilitiesState.is_pressed(obj)
-        AXUtilitiesEvent.LAST_KNOWN_SELECTED[hash(obj)] = AXUtilitiesState.is_selected(obj)
-
+        if not AXUtilitiesEvent._cache_clearing_thread_started:
+            with AXUtilitiesEvent._lock:
+                if not AXUtilitiesEvent._cache_clearing_thread_started:
+                    AXUtilitiesEvent._cache_clearing_thread_started = True
+                    AXUtilitiesEvent.start_cache_clearing_thread()
+
+        info = AXUtilitiesEvent._get_last_known(hash(obj))
+        info.description = AXObject.get_description(obj)
+        info.name = AXObject.get_name(obj)
+        info.checked = AXUtilitiesState.is_checked(obj)
+        info.expanded = AXUtilitiesState.is_expanded(obj)
+        info.indeterminate = AXUtilitiesState.is_indeterminate(obj)
+        info.pressed = AXUtilitiesState.is_pressed(obj)
+        info.selected = AXUtilitiesState.is_selected(obj)
+
+        # The active window rarely changes between saves, and name changes on it
+        # are tracked by is_presentable_name_change, so only (re)capture its
+        # properties when a different window has become active.
         window = focus_manager.get_manager().get_active_window()
-        AXUtilitiesEvent.LAST_KNOWN_NAME[hash(window)] = AXObject.get_name(window)
-        AXUtilitiesEvent.LAST_KNOWN_DESCRIPTION[hash(window)] = AXObject.get_description(window)
+        window_key = hash(window)
+        if window_key != AXUtilitiesEvent._last_window_key:
+            AXUtilitiesEvent._last_window_key = window_key
+            window_info = AXUtilitiesEvent._get_last_known(window_key)
+            window_info.name = AXObject.get_name(window)
+            window_info.description = AXObject.get_description(window)
 
     @staticmethod
     def start_cache_clearing_thread() -> None:
         """Starts thread to periodically clear cached details."""
 
+        AXUtilitiesEvent._stop_cache_clearing.clear()
         thread = threading.Thread(target=AXUtilitiesEvent._clear_stored_data)
         thread.daemon = True
         thread.start()
 
+    @staticmethod
+    def stop_cache_clearing_thread() -> None:
+        """Stops the periodic clearing of cached details."""
+
+        AXUtilitiesEvent._stop_cache_clearing.set()
+
     @staticmethod
     def get_last_known_name(obj: Atspi.Accessible) -> str:
         """Returns the last known name of obj."""
 
-        return AXUtilitiesEvent.LAST_KNOWN_NAME.get(hash(obj), "")
+        info = AXUtilitiesEvent.LAST_KNOWN.get(hash(obj))
+        if info is None or info.name is None:
+            return ""
+        return info.name
 
     @staticmethod
     def get_text_event_reason(event: Atspi.Event) -> TextEventReason:
@@ -183,8 +286,9 @@ class AXUtilitiesEvent:
 
         reason = AXUtilitiesEvent.TEXT_EVENT_REASON.get(event)
         if reason is not None:
-            tokens = ["AXUtilitiesEvent: Cached reason for", event, f": {reason}"]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                tokens = ["AXUtilitiesEvent: Cached reason for", event, f": {reason}"]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return reason
 
         reason = TextEventReason.UNKNOWN
@@ -199,11 +303,24 @@ class AXUtilitiesEvent:
         else:
             raise ValueError(f"Unexpected event type: {event.type}")
 
-        AXUtilitiesEvent.TEXT_EVENT_REASON[event] = reason
-        tokens = ["AXUtilitiesEvent: Reason for", event, f": {reason}"]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        memo = AXUtilitiesEvent.TEXT_EVENT_REASON
+        if len(memo) >= AXUtilitiesEvent._MAX_REASON_ENTRIES:
+            memo.pop(next(iter(memo)))
+        memo[event] = reason
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            tokens = ["AXUtilitiesEvent: Reason for", event, f": {reason}"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         return reason
 
+    @staticmethod
+    def _first_matching_reason(mgr, pairs, default: TextEventReason) -> TextEventReason:
+        """Returns the reason paired with the first matching predicate on mgr."""
+
+        for name, reason in pairs:
+            if getattr(mgr, name)():
+                return reason
+        return default
+
     @staticmethod
     def _get_caret_moved_event_reason(event: Atspi.Event) -> TextEventReason:
         """Returns the TextEventReason for the given event."""
@@ -218,58 +335,18 @@ class AXUtilitiesEvent:
             else:
                 reason = TextEventReason.SEARCH_PRESENTABLE
         elif mgr.last_event_was_caret_selection():
-            if mgr.last_event_was_line_navigation():
-                reason = TextEventReason.SELECTION_BY_LINE
-            elif mgr.last_event_was_word_navigation():
-                reason = TextEventReason.SELECTION_BY_WORD
-            elif mgr.last_event_was_character_navigation():
-                reason = TextEventReason.SELECTION_BY_CHARACTER
-            elif mgr.last_event_was_page_navigation():
-                reason = TextEventReason.SELECTION_BY_PAGE
-            elif mgr.last_event_was_line_boundary_navigation():
-                reason = TextEventReason.SELECTION_TO_LINE_BOUNDARY
-            elif mgr.last_event_was_file_boundary_navigation():
-                reason = TextEventReason.SELECTION_TO_FILE_BOUNDARY
-            else:
-                reason = TextEventReason.UNSPECIFIED_SELECTION
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _SELECTION_NAV_PAIRS, TextEventReason.UNSPECIFIED_SELECTION)
         elif mgr.last_event_was_caret_navigation():
-            if mgr.last_event_was_line_navigation():
-                reason = TextEventReason.NAVIGATION_BY_LINE
-            elif mgr.last_event_was_word_navigation():
-                reason = TextEventReason.NAVIGATION_BY_WORD
-            elif mgr.last_event_was_character_navigation():
-                reason = TextEventReason.NAVIGATION_BY_CHARACTER
-            elif mgr.last_event_was_page_navigation():
-                reason = TextEventReason.NAVIGATION_BY_PAGE
-            elif mgr.last_event_was_line_boundary_navigation():
-                reason = TextEventReason.NAVIGATION_TO_LINE_BOUNDARY
-            elif mgr.last_event_was_file_boundary_navigation():
-                reason = TextEventReason.NAVIGATION_TO_FILE_BOUNDARY
-            else:
-                reason = TextEventReason.UNSPECIFIED_NAVIGATION
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _CARET_NAV_PAIRS, TextEventReason.UNSPECIFIED_NAVIGATION)
         elif mgr.last_event_was_select_all():
             reason = TextEventReason.SELECT_ALL
         elif mgr.last_event_was_primary_click_or_release():
             reason = TextEventReason.MOUSE_PRIMARY_BUTTON
         elif AXUtilitiesState.is_editable(obj) or AXUtilitiesRole.is_terminal(obj):
-            if mgr.last_event_was_backspace():
-                reason = TextEventReason.BACKSPACE
-            elif mgr.last_event_was_delete():
-                reason = TextEventReason.DELETE
-            elif mgr.last_event_was_cut():
-                reason = TextEventReason.CUT
-            elif mgr.last_event_was_paste():
-                reason = TextEventReason.PASTE
-            elif mgr.last_event_was_undo():
-                reason = TextEventReason.UNDO
-            elif mgr.last_event_was_redo():
-                reason = TextEventReason.REDO
-            elif mgr.last_event_was_page_switch():
-                reason = TextEventReason.PAGE_SWITCH
-            elif mgr.last_event_was_command():
-                reason = TextEventReason.UNSPECIFIED_COMMAND
-            elif mgr.last_event_was_printable_key():
-                reason = TextEventReason.TYPING
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _CARET_EDITABLE_PAIRS, TextEventReason.UNKNOWN)
         return reason
 
     @staticmethod
@@ -279,28 +356,16 @@ class AXUtilitiesEvent:
         reason = TextEventReason.UNKNOWN
         mgr = input_event_manager.get_manager()
         obj = event.source
-        if AXObject.get_role(obj) in AXUtilitiesRole.get_text_ui_roles():
+        if AXObject.get_role(obj) in _TEXT_UI_ROLES:
             reason = TextEventReason.UI_UPDATE
         elif mgr.last_event_was_page_switch():
             reason = TextEventReason.PAGE_SWITCH
         elif AXUtilitiesState.is_editable(obj) or AXUtilitiesRole.is_terminal(obj):
-            if mgr.last_event_was_backspace():
-                reason = TextEventReason.BACKSPACE
-            elif mgr.last_event_was_delete():
-                reason = TextEventReason.DELETE
-            elif mgr.last_event_was_cut():
-                reason = TextEventReason.CUT
-            elif mgr.last_event_was_paste():
-                reason = TextEventReason.PASTE
-            elif mgr.last_event_was_undo():
-                reason = TextEventReason.UNDO
-            elif mgr.last_event_was_redo():
-                reason = TextEventReason.REDO
-            elif mgr.last_event_was_command():
-                reason = TextEventReason.UNSPECIFIED_COMMAND
-            elif mgr.last_event_was_printable_key():
-                reason = TextEventReason.TYPING
-            elif mgr.last_event_was_up_or_down() or mgr.last_event_was_page_up_or_page_down():
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _TEXT_CHANGE_EDITABLE_PAIRS, TextEventReason.UNKNOWN)
+            if reason == TextEventReason.UNKNOWN \
+               and (mgr.last_event_was_up_or_down()
+                    or mgr.last_event_was_page_up_or_page_down()):
                 if AXUtilitiesRole.is_spin_button(obj) \
                    or AXObject.find_ancestor(obj, AXUtilitiesRole.is_spin_button):
                     reason = TextEventReason.SPIN_BUTTON_VALUE_CHANGE
@@ -312,7 +377,7 @@ class AXUtilitiesEvent:
                     reason = TextEventReason.SELECTED_TEXT_DELETION
         elif mgr.last_event_was_command():
             reason = TextEventReason.UNSPECIFIED_COMMAND
-        elif "\ufffc" in event.any_data and not event.any_data.replace("\ufffc", ""):
+        elif event.any_data and not event.any_data.strip("\ufffc"):
             reason = TextEventReason.CHILDREN_CHANGE
         return reason
 
@@ -323,13 +388,13 @@ class AXUtilitiesEvent:
         reason = TextEventReason.UNKNOWN
         mgr = input_event_manager.get_manager()
         obj = event.source
-        if AXObject.get_role(obj) in AXUtilitiesRole.get_text_ui_roles():
+        if AXObject.get_role(obj) in _TEXT_UI_ROLES:
             reason = TextEventReason.UI_UPDATE
         elif mgr.last_event_was_page_switch():
             reason = TextEventReason.PAGE_SWITCH
         elif AXUtilitiesState.is_editable(obj) \
                 or AXUtilitiesRole.is_terminal(obj):
-            selected_text, _start, _end = AXText.get_selected_text(obj)
+            selected_text, _start, _end = AXText.get_cached_selected_text(obj)
             if selected_text and event.any_data == selected_text:
                 reason = TextEventReason.SELECTED_TEXT_INSERTION
             if mgr.last_event_was_backspace():
@@ -371,10 +436,8 @@ class AXUtilitiesEvent:
                     reason = TextEventReason.SPIN_BUTTON_VALUE_CHANGE
                 else:
                     reason = TextEventReason.AUTO_INSERTION_PRESENTABLE
-            if reason == TextEventReason.UNKNOWN:
-                if len(event.any_data) == 1:
-                    pass
-                elif mgr.last_event_was_tab() and event.any_data != "\t":
+            if reason == TextEventReason.UNKNOWN and len(event.any_data) > 1:
+                if mgr.last_event_was_tab() and event.any_data != "\t":
                     reason = TextEventReason.AUTO_INSERTION_PRESENTABLE
                 elif mgr.last_event_was_return() and event.any_data != "\n":
                     if AXUtilitiesState.is_single_line(event.source):
@@ -384,7 +447,7 @@ class AXUtilitiesEvent:
                         reason = TextEventReason.AUTO_INSERTION_PRESENTABLE
         elif mgr.last_event_was_command():
             reason = TextEventReason.UNSPECIFIED_COMMAND
-        elif "\ufffc" in event.any_data and not event.any_data.replace("\ufffc", ""):
+        elif event.any_data and not event.any_data.strip("\ufffc"):
             reason = TextEventReason.CHILDREN_CHANGE
 
         return reason
@@ -403,62 +466,24 @@ class AXUtilitiesEvent:
             else:
                 reason = TextEventReason.SEARCH_PRESENTABLE
         elif mgr.last_event_was_caret_selection():
-            if mgr.last_event_was_line_navigation():
-                reason = TextEventReason.SELECTION_BY_LINE
-            elif mgr.last_event_was_word_navigation():
-                reason = TextEventReason.SELECTION_BY_WORD
-            elif mgr.last_event_was_character_navigation():
-                reason = TextEventReason.SELECTION_BY_CHARACTER
-            elif mgr.last_event_was_page_navigation():
-                reason = TextEventReason.SELECTION_BY_PAGE
-            elif mgr.last_event_was_line_boundary_navigation():
-                reason = TextEventReason.SELECTION_TO_LINE_BOUNDARY
-            elif mgr.last_event_was_file_boundary_navigation():
-                reason = TextEventReason.SELECTION_TO_FILE_BOUNDARY
-            else:
-                reason = TextEventReason.UNSPECIFIED_SELECTION
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _SELECTION_NAV_PAIRS, TextEventReason.UNSPECIFIED_SELECTION)
         elif mgr.last_event_was_caret_navigation():
-            if mgr.last_event_was_line_navigation():
-                reason = TextEventReason.NAVIGATION_BY_LINE
-            elif mgr.last_event_was_word_navigation():
-                reason = TextEventReason.NAVIGATION_BY_WORD
-            elif mgr.last_event_was_character_navigation():
-                reason = TextEventReason.NAVIGATION_BY_CHARACTER
-            elif mgr.last_event_was_page_navigation():
-                reason = TextEventReason.NAVIGATION_BY_PAGE
-            elif mgr.last_event_was_line_boundary_navigation():
-                reason = TextEventReason.NAVIGATION_TO_LINE_BOUNDARY
-            elif mgr.last_event_was_file_boundary_navigation():
-                reason = TextEventReason.NAVIGATION_TO_FILE_BOUNDARY
-            else:
-                reason = TextEventReason.UNSPECIFIED_NAVIGATION
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _CARET_NAV_PAIRS, TextEventReason.UNSPECIFIED_NAVIGATION)
         elif mgr.last_event_was_select_all():
             reason = TextEventReason.SELECT_ALL
         elif mgr.last_event_was_primary_click_or_release():
             reason = TextEventReason.MOUSE_PRIMARY_BUTTON
         elif AXUtilitiesState.is_editable(obj) or AXUtilitiesRole.is_terminal(obj):
-            if mgr.last_event_was_backspace():
-                reason = TextEventReason.BACKSPACE
-            elif mgr.last_event_was_delete():
-                reason = TextEventReason.DELETE
-            elif mgr.last_event_was_cut():
-                reason = TextEventReason.CUT
-            elif mgr.last_event_was_paste():
-                reason = TextEventReason.PASTE
-            elif mgr.last_event_was_undo():
-                reason = TextEventReason.UNDO
-            elif mgr.last_event_was_redo():
-                reason = TextEventReason.REDO
-            elif mgr.last_event_was_page_switch():
-                reason = TextEventReason.PAGE_SWITCH
-            elif mgr.last_event_was_command():
-                reason = TextEventReason.UNSPECIFIED_COMMAND
-            elif mgr.last_event_was_printable_key():
-                reason = TextEventReason.TYPING
-            elif mgr.last_event_was_up_or_down() or mgr.last_event_was_page_up_or_page_down():
-                if AXUtilitiesRole.is_spin_button(obj) \
-                   or AXObject.find_ancestor(obj, AXUtilitiesRole.is_spin_button):
-                    reason = TextEventReason.SPIN_BUTTON_VALUE_CHANGE
+            reason = AXUtilitiesEvent._first_matching_reason(
+                mgr, _CARET_EDITABLE_PAIRS, TextEventReason.UNKNOWN)
+            if reason == TextEventReason.UNKNOWN \
+               and (mgr.last_event_was_up_or_down()
+                    or mgr.last_event_was_page_up_or_page_down()) \
+               and (AXUtilitiesRole.is_spin_button(obj)
+                    or AXObject.find_ancestor(obj, AXUtilitiesRole.is_spin_button)):
+                reason = TextEventReason.SPIN_BUTTON_VALUE_CHANGE
         return reason
 
     @staticmethod
@@ -492,14 +517,12 @@ class AXUtilitiesEvent:
     def is_presentable_checked_change(event: Atspi.Event) -> bool:
         """Returns True if this event should be presented as a checked-state change."""
 
-        old_state = AXUtilitiesEvent.LAST_KNOWN_CHECKED.get(hash(event.source))
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
         new_state = AXUtilitiesState.is_checked(event.source)
-        if old_state == new_state:
+        if not AXUtilitiesEvent._update_and_changed(info, "checked", new_state):
             msg = "AXUtilitiesEvent: The new state matches the old state."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
-
-        AXUtilitiesEvent.LAST_KNOWN_CHECKED[hash(event.source)] = new_state
         focus = focus_manager.get_manager().get_locus_of_focus()
         if event.source != focus:
             if not AXObject.is_ancestor(event.source, focus):
@@ -527,14 +550,12 @@ class AXUtilitiesEvent:
     def is_presentable_description_change(event: Atspi.Event) -> bool:
         """Returns True if this event should be presented as a description change."""
 
-        old_description = AXUtilitiesEvent.LAST_KNOWN_DESCRIPTION.get(hash(event.source))
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
         new_description = event.any_data
-        if old_description == new_description:
+        if not AXUtilitiesEvent._update_and_changed(info, "description", new_description):
             msg = "AXUtilitiesEvent: The new description matches the old description."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
-
-        AXUtilitiesEvent.LAST_KNOWN_DESCRIPTION[hash(event.source)] = new_description
         if not new_description:
             msg = "AXUtilitiesEvent: The description is empty."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -559,14 +580,12 @@ class AXUtilitiesEvent:
     def is_presentable_expanded_change(event: Atspi.Event) -> bool:
         """Returns True if this event should be presented as an expanded-state change."""
 
-        old_state = AXUtilitiesEvent.LAST_KNOWN_EXPANDED.get(hash(event.source))
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
         new_state = AXUtilitiesState.is_expanded(event.source)
-        if old_state == new_state:
+        if not AXUtilitiesEvent._update_and_changed(info, "expanded", new_state):
             msg = "AXUtilitiesEvent: The new state matches the old state."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
-
-        AXUtilitiesEvent.LAST_KNOWN_EXPANDED[hash(event.source)] = new_state
         if event.source == focus_manager.get_manager().get_locus_of_focus():
             msg = "AXUtilitiesEvent: Event is presentable, from the locus of focus."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -591,15 +610,13 @@ class AXUtilitiesEvent:
     def is_presentable_indeterminate_change(event: Atspi.Event) -> bool:
         """Returns True if this event should be presented as an indeterminate-state change."""
 
-        old_state = AXUtilitiesEvent.LAST_KNOWN_INDETERMINATE.get(hash(event.source))
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
         new_state = AXUtilitiesState.is_indeterminate(event.source)
-        if old_state == new_state:
+        if not AXUtilitiesEvent._update_and_changed(info, "indeterminate", new_state):
             msg = "AXUtilitiesEvent: The new state matches the old state."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
 
-        AXUtilitiesEvent.LAST_KNOWN_INDETERMINATE[hash(event.source)] = new_state
-
         # If this state is cleared, the new state will become checked or unchecked
         # and we should get object:state-changed:checked events for those cases.
         if not new_state:
@@ -620,14 +637,13 @@ class AXUtilitiesEvent:
     def is_presentable_name_change(event: Atspi.Event) -> bool:
         """Returns True if this event should be presented as a name change."""
 
-        old_name = AXUtilitiesEvent.LAST_KNOWN_NAME.get(hash(event.source))
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
         new_name = event.any_data
-        if old_name == new_name:
+        if not AXUtilitiesEvent._update_and_changed(info, "name", new_name):
             msg = "AXUtilitiesEvent: The new name matches the old name."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
 
-        AXUtilitiesEvent.LAST_KNOWN_NAME[hash(event.source)] = new_name
         if not new_name:
             msg = "AXUtilitiesEvent: The name is empty."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -638,25 +654,31 @@ class AXUtilitiesEvent:
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
 
+        manager = focus_manager.get_manager()
         if AXUtilitiesRole.is_frame(event.source):
-            if event.source != focus_manager.get_manager().get_active_window():
+            if event.source != manager.get_active_window():
                 msg = "AXUtilitiesEvent: Event is for frame other than the active window."
                 debug.print_message(debug.LEVEL_INFO, msg, True)
                 return False
 
             # Example: Typing the subject in an email client causing the window name to change.
-            focus = focus_manager.get_manager().get_locus_of_focus()
-            if AXUtilitiesState.is_editable(focus) and AXText.get_character_count(focus) \
-               and AXText.get_all_text(focus) in event.any_data:
-                msg = "AXUtilitiesEvent: Event is redundant notification for the locus of focus."
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                return False
+            # Extracting the full text can be expensive, so rule it out by length first:
+            # text longer than the new name cannot be contained in it.
+            focus = manager.get_locus_of_focus()
+            if AXUtilitiesState.is_editable(focus):
+                char_count = AXText.get_character_count(focus)
+                if 0 < char_count <= len(event.any_data) \
+                   and AXText.get_all_text(focus) in event.any_data:
+                    msg = \
+                        "AXUtilitiesEvent: Event is redundant notification for the locus of focus."
+                    debug.print_message(debug.LEVEL_INFO, msg, True)
+                    return False
 
             msg = "AXUtilitiesEvent: Event is presentable."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
-        if event.source != focus_manager.get_manager().get_locus_of_focus():
+        if event.source != manager.get_locus_of_focus():
             msg = "AXUtilitiesEvent: The event is not from the locus of focus."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
@@ -666,17 +688,19 @@ class AXUtilitiesEvent:
         return True
 
     @staticmethod
-    def is_presentable_pressed_change(event: Atspi.Event) -> bool:
-        """Returns True if this event should be presented as a pressed-state change."""
-
-        old_state = AXUtilitiesEvent.LAST_KNOWN_PRESSED.get(hash(event.source))
-        new_state = AXUtilitiesState.is_pressed(event.source)
-        if old_state == new_state:
+    def _is_presentable_focused_state_change(
+        event: Atspi.Event,
+        field: str,
+        new_state: bool
+    ) -> bool:
+        """Returns True if a changed state on the locus of focus should be presented."""
+
+        info = AXUtilitiesEvent._get_last_known(hash(event.source))
+        if not AXUtilitiesEvent._update_and_changed(info, field, new_state):
             msg = "AXUtilitiesEvent: The new state matches the old state."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
 
-        AXUtilitiesEvent.LAST_KNOWN_PRESSED[hash(event.source)] = new_state
         if event.source != focus_manager.get_manager().get_locus_of_focus():
             msg = "AXUtilitiesEvent: The event is not from the locus of focus."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -687,25 +711,16 @@ class AXUtilitiesEvent:
         return True
 
     @staticmethod
-    def is_presentable_selected_change(event: Atspi.Event) -> bool:
-        """Returns True if this event should be presented as a selected-state change."""
-
-        old_state = AXUtilitiesEvent.LAST_KNOWN_SELECTED.get(hash(event.source))
-        new_state = AXUtilitiesState.is_selected(event.source)
-        if old_state == new_state:
-            msg = "AXUtilitiesEvent: The new state matches the old state."
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-            return False
+    def is_presentable_pressed_change(event: Atspi.Event) -> bool:
+        """Returns True if this event should be presented as a pressed-state change."""
 
-        AXUtilitiesEvent.LAST_KNOWN_SELECTED[hash(event.source)] = new_state
-        if event.source != focus_manager.get_manager().get_locus_of_focus():
-            msg = "AXUtilitiesEvent: The event is not from the locus of focus."
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-            return False
+        return AXUtilitiesEvent._is_presentable_focused_state_change(
+            event, "pressed", AXUtilitiesState.is_pressed(event.source))
 
-        msg = "AXUtilitiesEvent: Event is presentable."
-        debug.print_message(debug.LEVEL_INFO, msg, True)
-        return True
+    @staticmethod
+    def is_presentable_selected_change(event: Atspi.Event) -> bool:
+        """Returns True if this event should be presented as a selected-state change."""
 
+        return AXUtilitiesEvent._is_presentable_focused_state_change(
+            event, "selected", AXUtilitiesState.is_selected(event.source))
 
-AXUtilitiesEvent.start_cache_clearing_thread()
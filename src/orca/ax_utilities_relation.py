@@ -49,6 +49,7 @@ class AXUtilitiesRelation:
     """Utilities for obtaining relation-related information."""
 
     RELATIONS: dict[int, list[Atspi.Relation]] = {}
+    RELATIONS_BY_TYPE: dict[int, dict[Atspi.RelationType, Atspi.Relation]] = {}
     TARGETS: dict[int, dict[Atspi.RelationType, list[Atspi.Accessible]]] = {}
 
     _lock = threading.Lock()
@@ -70,6 +71,7 @@ class AXUtilitiesRelation:
 
         with AXUtilitiesRelation._lock:
             AXUtilitiesRelation.RELATIONS.clear()
+            AXUtilitiesRelation.RELATIONS_BY_TYPE.clear()
             AXUtilitiesRelation.TARGETS.clear()
 
     @staticmethod
@@ -105,6 +107,8 @@ class AXUtilitiesRelation:
             return []
 
         AXUtilitiesRelation.RELATIONS[hash(obj)] = relations
+        AXUtilitiesRelation.RELATIONS_BY_TYPE[hash(obj)] = \
+            {relation.get_relation_type(): relation for relation in relations if relation}
         return relations
 
     @staticmethod
@@ -114,11 +118,12 @@ class AXUtilitiesRelation:
     ) -> Optional[Atspi.Relation]:
         """Returns the specified Atspi.Relation for obj"""
 
-        for relation in AXUtilitiesRelation.get_relations(obj):
-            if relation and relation.get_relation_type() == relation_type:
-                return relation
+        by_type = AXUtilitiesRelation.RELATIONS_BY_TYPE.get(hash(obj))
+        if by_type is None:
+            AXUtilitiesRelation.get_relations(obj)
+            by_type = AXUtilitiesRelation.RELATIONS_BY_TYPE.get(hash(obj), {})
 
-        return None
+        return by_type.get(relation_type)
 
     @staticmethod
     def get_relation_targets_for_debugging(
@@ -25,6 +25,7 @@
 # pylint: disable=too-many-statements
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-many-locals
+# pylint: disable=unused-argument
 
 """Manager for accessible object events."""
 
@@ -37,8 +38,8 @@ __date__      = "$Date$"
 __copyright__ = "Copyright (c) 2011-2024 Igalia, S.L."
 __license__   = "LGPL"
 
+import heapq
 import itertools
-import queue
 import threading
 import time
 from typing import Optional, TYPE_CHECKING
@@ -61,24 +62,111 @@ from .ax_utilities_debugging import AXUtilitiesDebugging
 if TYPE_CHECKING:
     from .scripts import default
 
+# Event-type prefixes for which a newer event of the same type from the same
+# source renders the queued one obsolete.
+_OBSOLETING_SAME_TYPE_PREFIXES = (
+    "document:page-changed",
+    "object:active-descendant-changed",
+    "object:children-changed",
+    "object:property-change",
+    "object:state-changed",
+    "object:selection-changed",
+    "object:text-caret-moved",
+    "object:text-selection-changed",
+    "window",
+)
+
+_WINDOW_ACTIVATION_PREFIXES = ("window:activate", "window:deactivate")
+
+# Roles for which events from an unfocused source are ignored, per event family.
+_IGNORED_NAME_CHANGE_ROLES = frozenset({
+    Atspi.Role.CANVAS,
+    Atspi.Role.CHECK_BOX,    # TeamTalk5 spam
+    Atspi.Role.ICON,
+    Atspi.Role.IMAGE,        # Thunderbird spam
+    Atspi.Role.LIST,         # Web app spam
+    Atspi.Role.LIST_ITEM,    # Web app spam
+    Atspi.Role.MENU,
+    Atspi.Role.MENU_ITEM,
+    Atspi.Role.PANEL,        # TeamTalk5 spam
+    Atspi.Role.RADIO_BUTTON, # TeamTalk5 spam
+    Atspi.Role.SECTION,      # Web app spam
+    Atspi.Role.TABLE_ROW,    # Thunderbird spam
+    Atspi.Role.TABLE_CELL,   # Thunderbird spam
+    Atspi.Role.TREE_ITEM,    # Thunderbird spam
+})
+
+_IGNORED_VALUE_CHANGE_ROLES = frozenset({
+    Atspi.Role.SPLIT_PANE,
+    Atspi.Role.SCROLL_BAR,
+})
+
+# Thunderbird spams us with these when a message list thread is expanded/collapsed.
+_IGNORED_SYSTEM_STATE_CHANGE_ROLES = frozenset({
+    Atspi.Role.TABLE,
+    Atspi.Role.TABLE_CELL,
+    Atspi.Role.TABLE_ROW,
+    Atspi.Role.TREE,
+    Atspi.Role.TREE_ITEM,
+    Atspi.Role.TREE_TABLE,
+})
+
+# The Gedit and Thunderbird scripts pay attention to sensitive events for spellcheck.
+_SENSITIVE_CHANGE_ROLES = frozenset({
+    Atspi.Role.TEXT,
+    Atspi.Role.ENTRY,
+})
+
+_PRESENTABLE_SHOWING_ROLES = frozenset({
+    Atspi.Role.ALERT,
+    Atspi.Role.ANIMATION,
+    Atspi.Role.DIALOG,
+    Atspi.Role.INFO_BAR,
+    Atspi.Role.MENU,
+    Atspi.Role.NOTIFICATION,
+    Atspi.Role.STATUS_BAR,
+    Atspi.Role.TOOL_TIP,
+})
+
 class EventManager:
     """Manager for accessible object events."""
 
+    # How many queued events one idle callback may process before yielding
+    # control back to the main loop.
+    EVENTS_PER_IDLE = 8
+
     PRIORITY_IMMEDIATE = 1
     PRIORITY_IMPORTANT = 2
     PRIORITY_HIGH = 3
     PRIORITY_NORMAL = 4
     PRIORITY_LOW = 5
 
+    # Maps the two-segment event-type prefix to queue priority, for families
+    # whose priority does not depend on the event source.
+    _EVENT_PRIORITIES = {
+        "object:active-descendant-changed": PRIORITY_HIGH,
+        "object:children-changed": PRIORITY_LOW,
+    }
+
+    # Maps the two-segment event-type prefix to the method which decides whether
+    # events with that prefix should be ignored.
+    _IGNORE_CHECKS = {
+        "object:children-changed": "_ignore_children_changed",
+        "object:property-change": "_ignore_property_change",
+        "object:selection-changed": "_ignore_selection_changed",
+        "object:state-changed": "_ignore_state_changed",
+        "object:text-caret-moved": "_ignore_caret_moved",
+        "object:text-changed": "_ignore_text_changed",
+    }
+
     def __init__(self) -> None:
         debug.print_message(debug.LEVEL_INFO, "EVENT MANAGER: Initializing", True)
         self._script_listener_counts: dict[str, int] = {}
         self._active: bool = False
         self._paused: bool = False
         self._counter = itertools.count()
-        self._event_queue: queue.PriorityQueue[
-            tuple[int, int, Atspi.Event]
-        ] = queue.PriorityQueue(0)
+        # A heap of (priority, counter, event) tuples, guarded by _gidle_lock.
+        self._event_queue: list[tuple[int, int, Atspi.Event]] = []
         self._gidle_id: int = 0
         self._gidle_lock = threading.Lock()
         self._listener: Atspi.EventListener = Atspi.EventListener.new(self._enqueue_object_event)
@@ -107,7 +195,7 @@ class EventManager:
 
         input_event_manager.get_manager().stop_key_watcher()
         self._active = False
-        self._event_queue = queue.PriorityQueue(0)
+        self._event_queue = []
         self._script_listener_counts = {}
         debug.print_message(debug.LEVEL_INFO, 'EVENT MANAGER: Deactivated', True)
 
@@ -120,7 +208,7 @@ class EventManager:
         debug.print_message(debug.LEVEL_INFO, msg, True)
         self._paused = pause
         if clear_queue:
-            self._event_queue = queue.PriorityQueue(0)
+            self._event_queue = []
 
     def _get_priority(self, event: Atspi.Event) -> int:
         """Returns the priority associated with event."""
@@ -128,25 +216,31 @@ class EventManager:
         event_type = event.type
         if event_type.startswith("window"):
             priority = EventManager.PRIORITY_IMPORTANT
-        elif event_type == "object:state-changed:active" and \
-            (AXUtilities.is_frame(event.source) or AXUtilities.is_dialog_or_alert(event.source)):
-            priority = EventManager.PRIORITY_IMPORTANT
-        elif event_type.startswith("object:state-changed:focused"):
-            priority = EventManager.PRIORITY_HIGH
-        elif event_type.startswith("object:active-descendant-changed"):
-            priority = EventManager.PRIORITY_HIGH
-        elif event_type.startswith("object:children-changed"):
-            priority = EventManager.PRIORITY_LOW
+        elif event_type.startswith("object:state-changed"):
+            if event_type == "object:state-changed:active" and \
+               (AXUtilities.is_frame(event.source) or AXUtilities.is_dialog_or_alert(event.source)):
+                priority = EventManager.PRIORITY_IMPORTANT
+            elif event_type.startswith("object:state-changed:focused"):
+                priority = EventManager.PRIORITY_HIGH
+            else:
+                priority = EventManager.PRIORITY_NORMAL
         else:
-            priority = EventManager.PRIORITY_NORMAL
+            priority = EventManager._EVENT_PRIORITIES.get(
+                ":".join(event_type.split(":", 2)[:2]), EventManager.PRIORITY_NORMAL)
 
-        tokens = ["EVENT MANAGER:", event, f"has priority level: {priority}"]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            tokens = ["EVENT MANAGER:", event, f"has priority level: {priority}"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         return priority
 
     def _is_obsoleted_by(self, event: Atspi.Event) -> Optional[Atspi.Event]:
         """Returns the event which renders this one no longer worthy of being processed."""
 
+        with self._gidle_lock:
+            if not self._event_queue:
+                return None
+            events = list(reversed(self._event_queue))
+
         def is_same(x):
             return x.type == event.type \
                 and x.source == event.source \
@@ -155,18 +249,7 @@ class EventManager:
                 and x.any_data == event.any_data
 
         def obsoletes_if_same_type_and_object(x):
-            skippable = {
-                "document:page-changed",
-                "object:active-descendant-changed",
-                "object:children-changed",
-                "object:property-change",
-                "object:state-changed",
-                "object:selection-changed",
-                "object:text-caret-moved",
-                "object:text-selection-changed",
-                "window",
-            }
-            if not any(x.type.startswith(etype) for etype in skippable):
+            if not x.type.startswith(_OBSOLETING_SAME_TYPE_PREFIXES):
                 return False
             return x.source == event.source and x.type == event.type
 
@@ -175,33 +258,18 @@ class EventManager:
                or x.any_data != event.any_data:
                 return False
 
-            skippable = {
-                "object:state-changed:focused",
-            }
-            if not any(x.type.startswith(etype) for etype in skippable):
+            if not x.type.startswith("object:state-changed:focused"):
                 return False
             return AXObject.get_parent(x.source) == AXObject.get_parent(event.source)
 
+        event_is_window_event = event.type.startswith(_WINDOW_ACTIVATION_PREFIXES)
+
         def obsoletes_window_event(x):
-            skippable = {
-                "window:activate",
-                "window:deactivate",
-            }
-            if not any(x.type.startswith(etype) for etype in skippable):
+            if not event_is_window_event:
                 return False
-            if not any(event.type.startswith(etype) for etype in skippable):
+            if not x.type.startswith(_WINDOW_ACTIVATION_PREFIXES):
                 return False
-            if x.source == event.source:
-                return True
-            return False
-
-        with self._event_queue.mutex:
-            try:
-                events = list(reversed(self._event_queue.queue))
-            except Exception as error:
-                msg = f"EVENT MANAGER: Exception in _isObsoletedBy: {error}"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                events = []
+            return x.source == event.source
 
         for _priority, _counter, e in events:
             if e == event:
@@ -232,239 +300,298 @@ class EventManager:
     def _ignore(self, event: Atspi.Event) -> bool:
         """Returns True if this event should be ignored."""
 
-        debug.print_message(debug.LEVEL_INFO, '')
-        tokens = ["EVENT MANAGER:", event]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            debug.print_message(debug.LEVEL_INFO, '')
+            tokens = ["EVENT MANAGER:", event]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
         if not self._active or self._paused:
-            msg = 'EVENT MANAGER: Ignoring because manager is not active or queueing is paused'
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = 'EVENT MANAGER: Ignoring because manager is not active or queueing is paused'
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
         event_type = event.type
-        if event_type.startswith('window') or event_type.startswith('mouse:button'):
+        if event_type.startswith(("window", "mouse:button")):
             return False
 
+        source = event.source
+        role = AXObject.get_role(source)
+
         # gnome-shell fires "focused" events spuriously after the Alt+Tab switcher
         # is used and something else has claimed focus. We don't want to update our
         # location or the keygrabs in response.
-        if AXUtilities.is_window(event.source) and "focused" in event_type:
-            msg = f"EVENT MANAGER: Ignoring {event_type} based on type and role"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+        if "focused" in event_type and AXUtilities.is_window(source, role):
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT MANAGER: Ignoring {event_type} based on type and role"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
         # Events on the window itself are typically something we want to handle.
-        if AXUtilities.is_frame(event.source):
-            app = AXUtilities.get_application(event.source)
+        if AXUtilities.is_frame(source, role):
+            app = AXUtilities.get_application(source)
             if AXObject.get_name(app) == "mutter-x11-frames":
-                msg = f"EVENT MANAGER: Ignoring {event_type} based on application"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
+                if debug.debugLevel <= debug.LEVEL_INFO:
+                    msg = f"EVENT MANAGER: Ignoring {event_type} based on application"
+                    debug.print_message(debug.LEVEL_INFO, msg, True)
                 return True
             return False
 
         # Text insertions in the text role are typically something we want to handle.
-        if AXUtilities.is_text(event.source):
+        if AXUtilities.is_text(source, role):
             return False
         # Notifications and alerts are things we want to handle.
-        if AXUtilities.is_notification(event.source) or AXUtilities.is_alert(event.source):
+        if AXUtilities.is_notification(source, role) \
+           or AXUtilities.is_alert(source, role):
             return False
 
         # Keep these checks early in the process so we can assume them throughout
         # the rest of our checks.
         focus = focus_manager.get_manager().get_locus_of_focus()
-        if focus == event.source \
-           or AXUtilities.is_focused(event.source) or AXUtilities.is_selected(event.source):
+        if focus == source \
+           or AXUtilities.is_focused(source) or AXUtilities.is_selected(source):
             return False
         if focus == event.any_data:
             return False
 
         last_app, last_time = self._event_history.get(event_type, (None, 0))
-        app = AXUtilities.get_application(event.source)
-        ignore = last_app == hash(app) and time.time() - last_time < 0.1
-        self._event_history[event_type] = hash(app), time.time()
+        app = AXUtilities.get_application(source)
+        app_hash = hash(app)
+        now = time.monotonic()
+        ignore = last_app == app_hash and now - last_time < 0.1
+        self._event_history[event_type] = app_hash, now
         if ignore:
-            msg = f"EVENT_MANAGER: Ignoring {event_type} due to multiple instances in short time"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT_MANAGER: Ignoring {event_type}: multiple instances in short time"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
         # mutter-x11-frames is firing accessibility events. We will never present them.
         if AXObject.get_name(app) == "mutter-x11-frames":
-            msg = f"EVENT MANAGER: Ignoring {event_type} based on application"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT MANAGER: Ignoring {event_type} based on application"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
-        if event_type.startswith("object:children-changed"):
-            if "remove" in event_type and focus and AXObject.is_dead(focus):
-                return False
-            if "remove" in event_type and event.source == AXUtilities.get_desktop():
-                return False
-            child = event.any_data
-            if child is None or AXObject.is_dead(child):
+        check = EventManager._IGNORE_CHECKS.get(":".join(event_type.split(":", 2)[:2]))
+        if check is not None:
+            return getattr(self, check)(event, event_type, role, focus, app)
+
+        return False
+
+    def _ignore_children_changed(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this children-changed event should be ignored."""
+
+        if "remove" in event_type and focus and AXObject.is_dead(focus):
+            return False
+        if "remove" in event_type and event.source == AXUtilities.get_desktop():
+            return False
+        child = event.any_data
+        if child is None or AXObject.is_dead(child):
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT_MANAGER: Ignoring {event_type} due to null/dead event.any_data"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            if AXUtilities.is_menu_related(child) or AXUtilities.is_image(child):
+            return True
+        if AXUtilities.is_menu_related(child) or AXUtilities.is_image(child):
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT_MANAGER: Ignoring {event_type} due to role of event.any_data"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            script = script_manager.get_manager().get_active_script()
-            if script is None:
+            return True
+        script = script_manager.get_manager().get_active_script()
+        if script is None:
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring {event_type} because there is no active script"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            if script.app != AXUtilities.get_application(event.source):
+            return True
+        if script.app != app:
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring {event_type} because event is not from active app"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
+            return True
+        return False
+
+    def _ignore_property_change(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this property-change event should be ignored."""
 
-        if event_type.startswith("object:property-change"):
-            role = AXObject.get_role(event.source)
-            if "name" in event_type:
-                if role in [Atspi.Role.CANVAS,
-                            Atspi.Role.CHECK_BOX,    # TeamTalk5 spam
-                            Atspi.Role.ICON,
-                            Atspi.Role.IMAGE,        # Thunderbird spam
-                            Atspi.Role.LIST,         # Web app spam
-                            Atspi.Role.LIST_ITEM,    # Web app spam
-                            Atspi.Role.MENU,
-                            Atspi.Role.MENU_ITEM,
-                            Atspi.Role.PANEL,        # TeamTalk5 spam
-                            Atspi.Role.RADIO_BUTTON, # TeamTalk5 spam
-                            Atspi.Role.SECTION,      # Web app spam
-                            Atspi.Role.TABLE_ROW,    # Thunderbird spam
-                            Atspi.Role.TABLE_CELL,   # Thunderbird spam
-                            Atspi.Role.TREE_ITEM]:   # Thunderbird spam
+        if "name" in event_type:
+            if role in _IGNORED_NAME_CHANGE_ROLES:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} due to role of unfocused source"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
-            if "value" in event_type:
-                if role in [Atspi.Role.SPLIT_PANE, Atspi.Role.SCROLL_BAR]:
+                return True
+            return False
+        if "value" in event_type:
+            if role in _IGNORED_VALUE_CHANGE_ROLES:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} due to role of unfocused source"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
+                return True
+            return False
+        return False
+
+    def _ignore_selection_changed(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this selection-changed event should be ignored."""
 
-        if event_type.startswith('object:selection-changed'):
-            if AXObject.is_dead(event.source):
+        if AXObject.is_dead(event.source):
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring {event_type} from dead source"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            return False
+            return True
+        return False
+
+    def _ignore_state_changed(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this state-changed event should be ignored."""
 
-        if event_type.startswith("object:state-changed"):
-            role = AXObject.get_role(event.source)
-            if event_type.endswith("system"):
-                # Thunderbird spams us with these when a message list thread is expanded/collapsed.
-                if role in [Atspi.Role.TABLE,
-                            Atspi.Role.TABLE_CELL,
-                            Atspi.Role.TABLE_ROW,
-                            Atspi.Role.TREE,
-                            Atspi.Role.TREE_ITEM,
-                            Atspi.Role.TREE_TABLE]:
+        if event_type.endswith("system"):
+            if role in _IGNORED_SYSTEM_STATE_CHANGE_ROLES:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} based on role"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-            if "checked" in event_type:
-                # Gtk 3 apps. See https://gitlab.gnome.org/GNOME/gtk/-/issues/6449
-                if not AXUtilities.is_showing(event.source):
+                return True
+        if "checked" in event_type:
+            # Gtk 3 apps. See https://gitlab.gnome.org/GNOME/gtk/-/issues/6449
+            if not AXUtilities.is_showing(event.source):
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} of unfocused, non-showing source"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
-            if "selected" in event_type:
-                if not event.detail1 and role in [Atspi.Role.PUSH_BUTTON]:
+                return True
+            return False
+        if "selected" in event_type:
+            if not event.detail1 and role == Atspi.Role.PUSH_BUTTON:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} due to role of source and detail1"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
-            if "sensitive" in event_type:
-                # The Gedit and Thunderbird scripts pay attention to this event for spellcheck.
-                if role not in [Atspi.Role.TEXT, Atspi.Role.ENTRY]:
+                return True
+            return False
+        if "sensitive" in event_type:
+            if role not in _SENSITIVE_CHANGE_ROLES:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} due to role of unfocused source"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
-            if "showing" in event_type:
-                if role not in [Atspi.Role.ALERT,
-                                Atspi.Role.ANIMATION,
-                                Atspi.Role.DIALOG,
-                                Atspi.Role.INFO_BAR,
-                                Atspi.Role.MENU,
-                                Atspi.Role.NOTIFICATION,
-                                Atspi.Role.STATUS_BAR,
-                                Atspi.Role.TOOL_TIP]:
+                return True
+            return False
+        if "showing" in event_type:
+            if role not in _PRESENTABLE_SHOWING_ROLES:
+                if debug.debugLevel <= debug.LEVEL_INFO:
                     msg = f"EVENT MANAGER: Ignoring {event_type} due to role"
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    return True
-                return False
+                return True
+            return False
+        return False
+
+    def _ignore_caret_moved(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this caret-moved event should be ignored."""
 
-        if event_type.startswith('object:text-caret-moved'):
-            role = AXObject.get_role(event.source)
-            if role in [Atspi.Role.LABEL]:
+        if role == Atspi.Role.LABEL:
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring {event_type} due to role of unfocused source"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            return False
+            return True
+        return False
+
+    def _ignore_text_changed(
+        self,
+        event: Atspi.Event,
+        event_type: str,
+        role: Atspi.Role,
+        focus: Optional[Atspi.Accessible],
+        app: Atspi.Accessible
+    ) -> bool:
+        """Returns True if this text-changed event should be ignored."""
 
-        if event_type.startswith('object:text-changed'):
-            if "insert" in event_type and event.detail2 > 1000:
+        if "insert" in event_type and event.detail2 > 1000:
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring {event_type} due to inserted text size"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            if event_type.endswith("system") and AXUtilities.is_selectable(focus):
-                # Thunderbird spams us with text changes every time the selected item changes.
+            return True
+        if event_type.endswith("system") and AXUtilities.is_selectable(focus):
+            # Thunderbird spams us with text changes every time the selected item changes.
+            if debug.debugLevel <= debug.LEVEL_INFO:
                 msg = f"EVENT MANAGER: Ignoring because {event_type} is suspected spam"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                return True
-            return False
-
+            return True
         return False
 
-    def _queue_println(
-        self,
-        event: input_event.InputEvent | Atspi.Event,
-        is_enqueue: bool = True
-    ) -> None:
+    def _queue_println(self, event: Atspi.Event, is_enqueue: bool = True) -> None:
         """Convenience method to output queue-related debugging info."""
 
         if debug.LEVEL_INFO < debug.debugLevel:
             return
 
-        tokens = []
-        if isinstance(event, input_event.KeyboardEvent):
-            tokens.extend([event.event_string, event.hw_code])
-        elif isinstance(event, input_event.BrailleEvent):
-            tokens.append(event.event)
-        else:
-            tokens.append(event)
-
         if is_enqueue:
-            tokens[0:0] = ["EVENT MANAGER: Queueing"]
+            tokens = ["EVENT MANAGER: Queueing", event]
         else:
-            tokens[0:0] = ["EVENT MANAGER: Dequeueing"]
+            tokens = ["EVENT MANAGER: Dequeueing", event]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
     def _enqueue_object_event(self, e: Atspi.Event) -> None:
         """Callback for Atspi object events."""
 
+        # Do this before any filtering so no handler can see stale cached data.
+        if e.type.startswith("object:state-changed"):
+            AXObject.clear_stored_states(e.source)
+        elif e.type.startswith("object:property-change:accessible-name"):
+            AXObject.clear_stored_name(e.source)
+        elif e.type.startswith("object:attributes-changed"):
+            AXObject.clear_stored_attributes(e.source)
+        elif e.type.startswith("object:children-changed") \
+                and isinstance(e.any_data, Atspi.Accessible):
+            AXObject.clear_stored_parent(e.any_data)
+
         if self._ignore(e):
             return
 
         self._queue_println(e)
         app = AXUtilities.get_application(e.source)
-        tokens = ["EVENT MANAGER: App for event source is", app]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            tokens = ["EVENT MANAGER: App for event source is", app]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
         script = script_manager.get_manager().get_script(app, e.source)
-        script.event_cache[e.type] = (e, time.time())
+        script.event_cache[e.type] = (e, time.monotonic())
 
         with self._gidle_lock:
             priority = self._get_priority(e)
             counter = next(self._counter)
-            self._event_queue.put((priority, counter, e))
-            tokens = ["EVENT MANAGER: Queued", e, f"priority: {priority}, counter: {counter}"]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            heapq.heappush(self._event_queue, (priority, counter, e))
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                tokens = ["EVENT MANAGER: Queued", e, f"priority: {priority}, counter: {counter}"]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             if not self._gidle_id:
                 self._gidle_id = GLib.idle_add(self._dequeue_object_event)
 
@@ -484,33 +611,45 @@ class EventManager:
 
         rerun = True
         try:
-            priority, counter, event = self._event_queue.get_nowait()
-            self._queue_println(event, is_enqueue=False)
-            tokens = ["EVENT MANAGER: Dequeued", event, f"priority: {priority}, counter: {counter}"]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-            start_time = time.time()
-            msg = (
-                f"\nvvvvv START PRIORITY-{priority} OBJECT EVENT {event.type.upper()} "
-                f"(queue size: {self._event_queue.qsize()}) vvvvv"
-            )
-            debug.print_message(debug.LEVEL_INFO, msg, False)
-            self._process_object_event(event)
-            msg = (
-                f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
-                f"\n^^^^^ FINISHED PRIORITY-{priority} OBJECT EVENT {event.type.upper()} ^^^^^\n"
-            )
-            debug.print_message(debug.LEVEL_INFO, msg, False)
-            with self._gidle_lock:
-                if self._event_queue.empty():
-                    GLib.timeout_add(2500, self._on_no_focus)
+            for _ in range(EventManager.EVENTS_PER_IDLE):
+                try:
+                    with self._gidle_lock:
+                        priority, counter, event = heapq.heappop(self._event_queue)
+                except IndexError:
+                    msg = 'EVENT MANAGER: Attempted dequeue, but the event queue is empty'
+                    debug.print_message(debug.LEVEL_SEVERE, msg, True)
                     self._gidle_id = 0
-                    rerun = False  # destroy and don't call again
+                    return False # destroy and don't call again
+                self._queue_println(event, is_enqueue=False)
+                debugging = debug.debugLevel <= debug.LEVEL_INFO
+                start_time = 0.0
+                if debugging:
+                    tokens = ["EVENT MANAGER: Dequeued", event,
+                              f"priority: {priority}, counter: {counter}"]
+                    debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                    start_time = time.time()
+                    msg = (
+                        f"\nvvvvv START PRIORITY-{priority} OBJECT EVENT {event.type.upper()} "
+                        f"(queue size: {len(self._event_queue)}) vvvvv"
+                    )
+                    debug.print_message(debug.LEVEL_INFO, msg, False)
+                self._process_object_event(event)
+                if debugging:
+                    msg = (
+                        f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
+                        f"\n^^^^^ FINISHED PRIORITY-{priority} OBJECT EVENT "
+                        f"{event.type.upper()} ^^^^^\n"
+                    )
+                    debug.print_message(debug.LEVEL_INFO, msg, False)
+                with self._gidle_lock:
+                    if not self._event_queue:
+                        GLib.timeout_add(2500, self._on_no_focus)
+                        self._gidle_id = 0
+                        return False  # destroy and don't call again
+                if event.type.startswith("window:activate"):
+                    # Let the main loop run so the newly-activated window can paint.
+                    break
 
-        except queue.Empty:
-            msg = 'EVENT MANAGER: Attempted dequeue, but the event queue is empty'
-            debug.print_message(debug.LEVEL_SEVERE, msg, True)
-            self._gidle_id = 0
-            rerun = False # destroy and don't call again
         except Exception:
             debug.print_exception(debug.LEVEL_SEVERE)
 
@@ -523,8 +662,9 @@ class EventManager:
         - event_type: the event type.
         """
 
-        msg = f'EVENT MANAGER: registering listener for: {event_type}'
-        debug.print_message(debug.LEVEL_INFO, msg, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            msg = f'EVENT MANAGER: registering listener for: {event_type}'
+            debug.print_message(debug.LEVEL_INFO, msg, True)
 
         if event_type in self._script_listener_counts:
             self._script_listener_counts[event_type] += 1
@@ -539,8 +679,9 @@ class EventManager:
         - event_type: the event type.
         """
 
-        msg = f'EVENT MANAGER: deregistering listener for: {event_type}'
-        debug.print_message(debug.LEVEL_INFO, msg, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            msg = f'EVENT MANAGER: deregistering listener for: {event_type}'
+            debug.print_message(debug.LEVEL_INFO, msg, True)
 
         if event_type not in self._script_listener_counts:
             return
@@ -584,33 +725,38 @@ class EventManager:
     ) -> Optional[default.Script]:
         """Returns the script associated with event."""
 
-        if event.source == focus_manager.get_manager().get_locus_of_focus():
+        source = event.source
+        if source == focus_manager.get_manager().get_locus_of_focus():
             script = active_script or script_manager.get_manager().get_active_script()
-            tokens = ["EVENT MANAGER: Script for event from locus of focus is", script]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                tokens = ["EVENT MANAGER: Script for event from locus of focus is", script]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return script
 
         if event.type.startswith("mouse:"):
             mouse_event = input_event.MouseButtonEvent(event)
             script = script_manager.get_manager().get_script(
                 mouse_event.app, mouse_event.window)
-            tokens = ["EVENT MANAGER: Script for event is", script]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                tokens = ["EVENT MANAGER: Script for event is", script]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return script
 
         script = None
-        app = AXUtilities.get_application(event.source)
+        app = AXUtilities.get_application(source)
         if AXUtilities.is_defunct(app):
             tokens = ["EVENT MANAGER:", app, "is defunct. Cannot get script for event."]
             debug.print_tokens(debug.LEVEL_WARNING, tokens, True)
             return None
 
-        tokens = ["EVENT MANAGER: Getting script for event for", app, event.source]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            tokens = ["EVENT MANAGER: Getting script for event for", app, source]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        script = script_manager.get_manager().get_script(app, event.source)
-        tokens = ["EVENT MANAGER: Script for event is", script]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        script = script_manager.get_manager().get_script(app, source)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            tokens = ["EVENT MANAGER: Script for event is", script]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         return script
 
     def _is_activatable_event(
@@ -618,7 +764,8 @@ class EventManager:
     ) -> tuple[bool, str]:
         """Determines if event should cause us to change the active script."""
 
-        if not event.source:
+        source = event.source
+        if not source:
             return False, "event.source? What event.source??"
 
         if not script:
@@ -626,7 +773,7 @@ class EventManager:
             if not script:
                 return False, "There is no script for this event."
 
-        app = AXUtilities.get_application(event.source)
+        app = AXUtilities.get_application(source)
         if app and not AXUtilities.is_application_in_desktop(app):
             return False, "The application is unknown to AT-SPI2"
 
@@ -642,10 +789,10 @@ class EventManager:
             window_activation = True
         else:
             window_activation = event_type.startswith('object:state-changed:active') \
-                and event.detail1 and AXUtilities.is_frame(event.source)
+                and event.detail1 and AXUtilities.is_frame(source)
 
         if window_activation:
-            if event.source != focus_manager.get_manager().get_active_window():
+            if source != focus_manager.get_manager().get_active_window():
                 return True, "Window activation"
             return False, "Window activation for already-active window"
 
@@ -653,13 +800,13 @@ class EventManager:
             return True, "Event source claimed focus."
 
         if event_type.startswith('object:state-changed:selected') and event.detail1 \
-           and AXUtilities.is_menu(event.source) and AXUtilities.is_focusable(event.source):
+           and AXUtilities.is_menu(source) and AXUtilities.is_focusable(source):
             return True, "Selection change in focused menu"
 
         # This condition appears with gnome-screensaver-dialog.
         # See bug 530368.
         if event_type.startswith('object:state-changed:showing') \
-           and AXUtilities.is_panel(event.source) and AXUtilities.is_modal(event.source):
+           and AXUtilities.is_panel(source) and AXUtilities.is_modal(source):
             return True, "Modal panel is showing."
 
         return False, "No reason found to activate a different script."
@@ -678,23 +825,27 @@ class EventManager:
         """Returns True if this event should be processed."""
 
         if event_script == active_script:
-            msg = f"EVENT MANAGER: Processing {event.type}: script for event is active"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT MANAGER: Processing {event.type}: script for event is active"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
         if event_script.present_if_inactive:
-            msg = f"EVENT MANAGER: Processing {event.type}: script handles events when inactive"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT MANAGER: Processing {event.type}: script handles events when inactive"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
         if AXUtilities.is_progress_bar(event.source) \
            and settings.progressBarVerbosity == settings.PROGRESS_BAR_ALL:
-            msg = f"EVENT MANAGER: Processing {event.type}: progress bar verbosity is 'all'"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f"EVENT MANAGER: Processing {event.type}: progress bar verbosity is 'all'"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             return True
 
-        msg = f"EVENT MANAGER: Not processing {event.type} due to lack of reason"
-        debug.print_message(debug.LEVEL_INFO, msg, True)
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            msg = f"EVENT MANAGER: Not processing {event.type} due to lack of reason"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
         return False
 
     def _process_object_event(self, event: Atspi.Event) -> None:
@@ -707,16 +858,17 @@ class EventManager:
         focus_mgr = focus_manager.get_manager()
 
         event_type = event.type
+        source = event.source
         if event_type.startswith("object:children-changed:remove") \
-           and event.source == AXUtilities.get_desktop():
+           and source == AXUtilities.get_desktop():
             script_mgr.reclaim_scripts()
             return
 
-        if AXObject.is_dead(event.source) or AXUtilities.is_defunct(event.source):
-            tokens = ["EVENT MANAGER: Ignoring defunct object:", event.source]
+        if AXObject.is_dead(source) or AXUtilities.is_defunct(source):
+            tokens = ["EVENT MANAGER: Ignoring defunct object:", source]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-            if event_type.startswith("window:de") and focus_mgr.get_active_window() == event.source:
+            if event_type.startswith("window:de") and focus_mgr.get_active_window() == source:
                 focus_mgr.clear_state("Active window is dead or defunct")
                 script_mgr.set_active_script(None, "Active window is dead or defunct")
             return
@@ -724,8 +876,8 @@ class EventManager:
         if event_type.startswith("window:") and event_type.endswith("destroy"):
             script_mgr.reclaim_scripts()
 
-        if AXUtilities.is_iconified(event.source):
-            tokens = ["EVENT MANAGER: Ignoring iconified object:", event.source]
+        if AXUtilities.is_iconified(source):
+            tokens = ["EVENT MANAGER: Ignoring iconified object:", source]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return
 
@@ -742,8 +894,9 @@ class EventManager:
 
         if script != active_script:
             set_new_active_script, reason = self._is_activatable_event(event, script)
-            msg = f'EVENT MANAGER: Change active script: {set_new_active_script} ({reason})'
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debug.debugLevel <= debug.LEVEL_INFO:
+                msg = f'EVENT MANAGER: Change active script: {set_new_active_script} ({reason})'
+                debug.print_message(debug.LEVEL_INFO, msg, True)
 
             if set_new_active_script:
                 script_mgr.set_active_script(script, reason)
@@ -759,18 +912,18 @@ class EventManager:
             if not self._should_process_event(event, script, active_script):
                 return
 
-        listener = script.listeners.get(event.type)
+        listener = script.listeners.get(event_type)
         # The listener can be None if the event type has a suffix such as "system".
         if listener is None:
             for key, value in script.listeners.items():
-                if event.type.startswith(key):
+                if event_type.startswith(key):
                     listener = value
                     break
 
         try:
             listener(event)
         except Exception as error:
-            msg = f"EVENT MANAGER: Exception processing {event.type}: {error}"
+            msg = f"EVENT MANAGER: Exception processing {event_type}: {error}"
             debug.print_message(debug.LEVEL_INFO, msg, True)
             debug.print_exception(debug.LEVEL_INFO)
 
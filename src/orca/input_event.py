@@ -670,46 +670,51 @@ class KeyboardEvent(InputEvent):
     def process(self):
         """Processes this input event."""
 
-        start_time = time.time()
-        if not self._should_obscure():
-            data = f"'{self.event_string}' ({self.hw_code})"
-        else:
-            data = "(obscured)"
+        debugging = debug.debugLevel <= debug.LEVEL_INFO
+        if debugging:
+            start_time = time.monotonic()
+            if not self._should_obscure():
+                data = f"'{self.event_string}' ({self.hw_code})"
+            else:
+                data = "(obscured)"
 
-        debug.print_message(debug.LEVEL_INFO, f"\n{self}")
+            debug.print_message(debug.LEVEL_INFO, f"\n{self}")
 
-        msg = f'\nvvvvv PROCESS {self.type.value_name.upper()}: {data} vvvvv'
-        debug.print_message(debug.LEVEL_INFO, msg, False)
+            msg = f'\nvvvvv PROCESS {self.type.value_name.upper()}: {data} vvvvv'
+            debug.print_message(debug.LEVEL_INFO, msg, False)
 
-        tokens = ["SCRIPT:", self._script]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            tokens = ["SCRIPT:", self._script]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        tokens = ["WINDOW:", self._window]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            tokens = ["WINDOW:", self._window]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        tokens = ["LOCATION:", self._obj]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            tokens = ["LOCATION:", self._obj]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
         if self._script:
             self._handler = self._get_user_handler() \
                 or self._script.key_bindings.get_input_handler(self)
-            tokens = ["HANDLER:", self._handler]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            if debugging:
+                tokens = ["HANDLER:", self._handler]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
             if self._script.get_learn_mode_presenter().is_active():
                 self._consumer = self._script.get_learn_mode_presenter().handle_event
-                tokens = ["CONSUMER:", self._consumer]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                if debugging:
+                    tokens = ["CONSUMER:", self._consumer]
+                    debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
         self._did_consume, self._result_reason = self._process()
-        tokens = ["CONSUMED:", self._did_consume, self._result_reason]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        if debugging:
+            tokens = ["CONSUMED:", self._did_consume, self._result_reason]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        msg = f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
-        debug.print_message(debug.LEVEL_INFO, msg, True)
+            msg = f"TOTAL PROCESSING TIME: {time.monotonic() - start_time:.4f}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
 
-        msg = f"^^^^^ PROCESS {self.type.value_name.upper()}: {data} ^^^^^\n"
-        debug.print_message(debug.LEVEL_INFO, msg, False)
+            msg = f"^^^^^ PROCESS {self.type.value_name.upper()}: {data} ^^^^^\n"
+            debug.print_message(debug.LEVEL_INFO, msg, False)
 
         return self._did_consume
 
@@ -738,28 +743,33 @@ class KeyboardEvent(InputEvent):
         return False, 'Unaddressed case'
 
     def _consume(self):
-        start_time = time.time()
-        data = f"'{self.event_string}' ({self.hw_code})"
-        msg = f'\nvvvvv CONSUME {self.type.value_name.upper()}: {data} vvvvv'
-        debug.print_message(debug.LEVEL_INFO, msg, False)
+        debugging = debug.debugLevel <= debug.LEVEL_INFO
+        if debugging:
+            start_time = time.monotonic()
+            data = f"'{self.event_string}' ({self.hw_code})"
+            msg = f'\nvvvvv CONSUME {self.type.value_name.upper()}: {data} vvvvv'
+            debug.print_message(debug.LEVEL_INFO, msg, False)
 
         if self._consumer:
-            msg = f'KEYBOARD EVENT: Consumer is {self._consumer.__name__}'
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debugging:
+                msg = f'KEYBOARD EVENT: Consumer is {self._consumer.__name__}'
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             self._consumer(self)
         elif self._handler.function and self._handler.is_enabled():
-            msg = f'KEYBOARD EVENT: Handler is {self._handler}'
-            debug.print_message(debug.LEVEL_INFO, msg, True)
+            if debugging:
+                msg = f'KEYBOARD EVENT: Handler is {self._handler}'
+                debug.print_message(debug.LEVEL_INFO, msg, True)
             self._handler.function(self._script, self)
-        else:
+        elif debugging:
             msg = 'KEYBOARD EVENT: No enabled handler or consumer'
             debug.print_message(debug.LEVEL_INFO, msg, True)
 
-        msg = f'TOTAL PROCESSING TIME: {time.time() - start_time:.4f}'
-        debug.print_message(debug.LEVEL_INFO, msg, True)
+        if debugging:
+            msg = f'TOTAL PROCESSING TIME: {time.monotonic() - start_time:.4f}'
+            debug.print_message(debug.LEVEL_INFO, msg, True)
 
-        msg = f'^^^^^ CONSUME {self.type.value_name.upper()}: {data} ^^^^^\n'
-        debug.print_message(debug.LEVEL_INFO, msg, False)
+            msg = f'^^^^^ CONSUME {self.type.value_name.upper()}: {data} ^^^^^\n'
+            debug.print_message(debug.LEVEL_INFO, msg, False)
 
         return False
 
@@ -799,16 +809,19 @@ class BrailleEvent(InputEvent):
     def process(self):
         """Processes this event."""
 
-        tokens = ["\nvvvvv PROCESS", self, "vvvvv"]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, False)
+        debugging = debug.debugLevel <= debug.LEVEL_INFO
+        if debugging:
+            tokens = ["\nvvvvv PROCESS", self, "vvvvv"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, False)
+            start_time = time.monotonic()
 
-        start_time = time.time()
         result = self._process()
-        msg = f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
-        debug.print_message(debug.LEVEL_INFO, msg, False)
+        if debugging:
+            msg = f"TOTAL PROCESSING TIME: {time.monotonic() - start_time:.4f}"
+            debug.print_message(debug.LEVEL_INFO, msg, False)
 
-        tokens = ["^^^^^ PROCESS", self, "^^^^^"]
-        debug.print_tokens(debug.LEVEL_INFO, tokens, False)
+            tokens = ["^^^^^ PROCESS", self, "^^^^^"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, False)
         return result
 
     def _process(self):
@@ -32,6 +32,8 @@ __copyright__ = "Copyright (c) 2005-2009 Sun Microsystems Inc." \
                 "Copyright (c) 2010-2013 The Orca Team."
 __license__   = "LGPL"
 
+import time
+
 import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk
@@ -60,9 +62,29 @@ from .speech_generator import SpeechGenerator
 class Script(default.Script):
     """Custom script for LibreOffice."""
 
+    # (attribute name, label, setting name, grid, row) for each check button
+    # in the app preferences GUI.
+    _PREFS_CHECK_BUTTONS = (
+        ("speak_spreadsheet_coordinates_check_button",
+         guilabels.SPREADSHEET_SPEAK_CELL_COORDINATES, "speakSpreadsheetCoordinates", "main", 0),
+        ("always_speak_selected_spreadsheet_range_check_button",
+         guilabels.SPREADSHEET_SPEAK_SELECTED_RANGE, "alwaysSpeakSelectedSpreadsheetRange",
+         "main", 1),
+        ("speak_cell_coordinates_check_button",
+         guilabels.TABLE_SPEAK_CELL_COORDINATES, "speakCellCoordinates", "table", 0),
+        ("speak_cell_span_check_button",
+         guilabels.TABLE_SPEAK_CELL_SPANS, "speakCellSpan", "table", 1),
+        ("speak_cell_headers_check_button",
+         guilabels.TABLE_ANNOUNCE_CELL_HEADER, "speakCellHeaders", "table", 2),
+        ("skip_blank_cells_check_button",
+         guilabels.TABLE_SKIP_BLANK_CELLS, "skipBlankCells", "table", 3),
+    )
+
     def __init__(self, app):
         super().__init__(app)
 
+        self._app_key_bindings = None
+        self._last_focused_paragraph = None, 0.0
         self.speak_spreadsheet_coordinates_check_button = None
         self.always_speak_selected_spreadsheet_range_check_button = None
         self.skip_blank_cells_check_button = None
@@ -94,6 +116,7 @@ class Script(default.Script):
         """Defines the input event handlers for this script."""
 
         default.Script.setup_input_event_handlers(self)
+        self._app_key_bindings = None
         self.input_event_handlers["presentInputLineHandler"] = \
             input_event.InputEventHandler(
                 Script.present_input_line,
@@ -114,6 +137,11 @@ class Script(default.Script):
     def get_app_key_bindings(self):
         """Returns the application-specific keybindings for this script."""
 
+        # The handlers only change when setup_input_event_handlers is re-run,
+        # which clears this cache, so the bindings can be built just once.
+        if self._app_key_bindings is not None:
+            return self._app_key_bindings
+
         bindings = keybindings.KeyBindings()
 
         bindings.add(
@@ -123,7 +151,7 @@ class Script(default.Script):
                 keybindings.ORCA_MODIFIER_MASK,
                 self.input_event_handlers["presentInputLineHandler"]))
 
-
+        self._app_key_bindings = bindings
         return bindings
 
     def get_app_preferences_gui(self):
@@ -133,20 +161,6 @@ class Script(default.Script):
         grid = Gtk.Grid()
         grid.set_border_width(12)
 
-        label = guilabels.SPREADSHEET_SPEAK_CELL_COORDINATES
-        value = settings_manager.get_manager().get_setting("speakSpreadsheetCoordinates")
-        self.speak_spreadsheet_coordinates_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.speak_spreadsheet_coordinates_check_button.set_active(value)
-        grid.attach(self.speak_spreadsheet_coordinates_check_button, 0, 0, 1, 1)
-
-        label = guilabels.SPREADSHEET_SPEAK_SELECTED_RANGE
-        value = settings_manager.get_manager().get_setting("alwaysSpeakSelectedSpreadsheetRange")
-        self.always_speak_selected_spreadsheet_range_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.always_speak_selected_spreadsheet_range_check_button.set_active(value)
-        grid.attach(self.always_speak_selected_spreadsheet_range_check_button, 0, 1, 1, 1)
-
         table_frame = Gtk.Frame()
         grid.attach(table_frame, 0, 2, 1, 1)
 
@@ -160,33 +174,13 @@ class Script(default.Script):
         table_grid = Gtk.Grid()
         table_alignment.add(table_grid)
 
-        label = guilabels.TABLE_SPEAK_CELL_COORDINATES
-        value = settings_manager.get_manager().get_setting("speakCellCoordinates")
-        self.speak_cell_coordinates_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.speak_cell_coordinates_check_button.set_active(value)
-        table_grid.attach(self.speak_cell_coordinates_check_button, 0, 0, 1, 1)
-
-        label = guilabels.TABLE_SPEAK_CELL_SPANS
-        value = settings_manager.get_manager().get_setting("speakCellSpan")
-        self.speak_cell_span_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.speak_cell_span_check_button.set_active(value)
-        table_grid.attach(self.speak_cell_span_check_button, 0, 1, 1, 1)
-
-        label = guilabels.TABLE_ANNOUNCE_CELL_HEADER
-        value = settings_manager.get_manager().get_setting("speakCellHeaders")
-        self.speak_cell_headers_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.speak_cell_headers_check_button.set_active(value)
-        table_grid.attach(self.speak_cell_headers_check_button, 0, 2, 1, 1)
-
-        label = guilabels.TABLE_SKIP_BLANK_CELLS
-        value = settings_manager.get_manager().get_setting("skipBlankCells")
-        self.skip_blank_cells_check_button = \
-            Gtk.CheckButton.new_with_mnemonic(label)
-        self.skip_blank_cells_check_button.set_active(value)
-        table_grid.attach(self.skip_blank_cells_check_button, 0, 3, 1, 1)
+        grids = {"main": grid, "table": table_grid}
+        manager = settings_manager.get_manager()
+        for attr, label, setting, grid_name, row in self._PREFS_CHECK_BUTTONS:
+            check_button = Gtk.CheckButton.new_with_mnemonic(label)
+            check_button.set_active(manager.get_setting(setting))
+            grids[grid_name].attach(check_button, 0, row, 1, 1)
+            setattr(self, attr, check_button)
 
         spellcheck = self.spellcheck.get_app_preferences_gui()
         grid.attach(spellcheck, 0, len(grid.get_children()), 1, 1)
@@ -197,28 +191,16 @@ class Script(default.Script):
     def get_preferences_from_gui(self):
         """Returns a dictionary with the app-specific preferences."""
 
-        prefs = {
-            'speakCellSpan':
-                self.speak_cell_span_check_button.get_active(),
-            'speakCellHeaders':
-                self.speak_cell_headers_check_button.get_active(),
-            'skipBlankCells':
-                self.skip_blank_cells_check_button.get_active(),
-            'speakCellCoordinates':
-                self.speak_cell_coordinates_check_button.get_active(),
-            'speakSpreadsheetCoordinates':
-                self.speak_spreadsheet_coordinates_check_button.get_active(),
-            'alwaysSpeakSelectedSpreadsheetRange':
-                self.always_speak_selected_spreadsheet_range_check_button.get_active(),
-        }
-
+        prefs = {setting: getattr(self, attr).get_active()
+                 for attr, _label, setting, _grid, _row in self._PREFS_CHECK_BUTTONS}
         prefs.update(self.spellcheck.get_preferences_from_gui())
         return prefs
 
     def pan_braille_left(self, event=None, pan_amount=0):
         """In document content, we want to use the panning keys to browse the entire document."""
 
-        focus = focus_manager.get_manager().get_locus_of_focus()
+        manager = focus_manager.get_manager()
+        focus = manager.get_locus_of_focus()
         if self.get_flat_review_presenter().is_active() \
            or not self.isBrailleBeginningShowing() \
            or self.utilities.isSpreadSheetCell(focus) \
@@ -232,7 +214,7 @@ class Script(default.Script):
 
         obj = self.utilities.findPreviousObject(focus)
         if obj is not None:
-            focus_manager.get_manager().set_locus_of_focus(None, obj, notify_script=False)
+            manager.set_locus_of_focus(None, obj, notify_script=False)
             AXText.set_caret_offset_to_end(obj)
             return True
 
@@ -241,7 +223,8 @@ class Script(default.Script):
     def pan_braille_right(self, event=None, pan_amount=0):
         """In document content, we want to use the panning keys to browse the entire document."""
 
-        focus = focus_manager.get_manager().get_locus_of_focus()
+        manager = focus_manager.get_manager()
+        focus = manager.get_locus_of_focus()
         if self.get_flat_review_presenter().is_active() \
            or not self.isBrailleEndShowing() \
            or self.utilities.isSpreadSheetCell(focus) \
@@ -255,7 +238,7 @@ class Script(default.Script):
 
         obj = self.utilities.findNextObject(focus)
         if obj is not None:
-            focus_manager.get_manager().set_locus_of_focus(None, obj, notify_script=False)
+            manager.set_locus_of_focus(None, obj, notify_script=False)
             AXText.set_caret_offset_to_start(obj)
             return True
 
@@ -299,7 +282,8 @@ class Script(default.Script):
         # fixes the broken echo previous word on Return.
         if new_focus != old_focus \
              and AXUtilities.is_paragraph(new_focus) and AXUtilities.is_paragraph(old_focus):
-            if input_event_manager.get_manager().last_event_was_return() \
+            manager = input_event_manager.get_manager()
+            if manager.last_event_was_return() \
                and settings_manager.get_manager().get_setting("enableEchoByWord"):
                 self.echoPreviousWord(old_focus)
                 return
@@ -307,7 +291,7 @@ class Script(default.Script):
             # TODO - JD: And this hack is another one that needs to be done better.
             # But this will get us to speak the entire paragraph when navigation by
             # paragraph has occurred.
-            if input_event_manager.get_manager().last_event_was_paragraph_navigation():
+            if manager.last_event_was_paragraph_navigation():
                 string = AXText.get_all_text(new_focus)
                 if string:
                     voice = self.speech_generator.voice(obj=new_focus, string=string)
@@ -345,7 +329,7 @@ class Script(default.Script):
 
         if event.source == self.spellcheck.get_suggestions_list():
             if AXUtilities.is_focused(event.source):
-                focus_manager.get_manager().set_locus_of_focus(event, event.any_data, False)
+                manager.set_locus_of_focus(event, event.any_data, False)
                 self.update_braille(event.any_data)
                 self.spellcheck.present_suggestion_list_item()
             else:
@@ -377,13 +361,18 @@ class Script(default.Script):
             return
 
         if AXUtilities.is_paragraph(event.source) and not AXUtilities.is_focused(event.source):
-            # TODO - JD: Can we remove this?
-            AXObject.clear_cache(event.source,
-                                 False,
-                                 "Caret-moved event from object which lacks focused state.")
-            if AXUtilities.is_focused(event.source):
-                msg = "SOFFICE: Clearing cache was needed due to missing state-changed event."
+            obj_hash, when = self._last_focused_paragraph
+            if obj_hash == hash(event.source) and time.monotonic() - when < 0.05:
+                msg = "SOFFICE: Not clearing cache; focused event for source just arrived."
                 debug.print_message(debug.LEVEL_INFO, msg, True)
+            else:
+                # TODO - JD: Can we remove this?
+                AXObject.clear_cache(event.source,
+                                     False,
+                                     "Caret-moved event from object which lacks focused state.")
+                if AXUtilities.is_focused(event.source):
+                    msg = "SOFFICE: Clearing cache was needed due to missing state-changed event."
+                    debug.print_message(debug.LEVEL_INFO, msg, True)
 
         if self.utilities.flows_from_or_to_selection(event.source):
             return
@@ -404,20 +393,25 @@ class Script(default.Script):
     def on_children_added(self, event):
         """Callback for object:children-changed:add accessibility events."""
 
-        if self.utilities.isSpreadSheetCell(event.any_data):
-            focus_manager.get_manager().set_locus_of_focus(event, event.any_data)
+        manager = focus_manager.get_manager()
+
+        # Most added children are not cells; a single role check spares us the
+        # ancestry-walking the cell checks below do.
+        is_cell = AXUtilities.is_table_cell_or_header(event.any_data)
+        if is_cell and self.utilities.isSpreadSheetCell(event.any_data):
+            manager.set_locus_of_focus(event, event.any_data)
             return
 
         AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
 
-        if AXTable.is_last_cell(event.any_data):
+        if is_cell and AXTable.is_last_cell(event.any_data):
             active_row = self.point_of_reference.get("lastRow", -1)
             active_col = self.point_of_reference.get("lastColumn", -1)
             if active_row < 0 or active_col < 0:
                 return
 
-            if focus_manager.get_manager().focus_is_dead():
-                focus_manager.get_manager().set_locus_of_focus(event, event.source, False)
+            if manager.focus_is_dead():
+                manager.set_locus_of_focus(event, event.source, False)
 
             self.utilities.handleUndoTextEvent(event)
             row_count = AXTable.get_row_count(event.source)
@@ -441,9 +435,11 @@ class Script(default.Script):
         if self._inSayAll:
             return
 
+        role = AXObject.get_role(event.source)
         manager = focus_manager.get_manager()
         focus = manager.get_locus_of_focus()
-        if AXUtilities.is_root_pane(event.source) and AXObject.is_ancestor(focus, event.source):
+        if AXUtilities.is_root_pane(event.source, role) \
+           and AXObject.is_ancestor(focus, event.source):
             msg = "SOFFICE: Event ignored: Source is root pane ancestor of current focus."
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return
@@ -452,39 +448,40 @@ class Script(default.Script):
             msg = "SOFFICE: Event ignored: Last input event was table navigation."
             debug.print_message(debug.LEVEL_INFO, msg, True)
 
-        if AXUtilities.is_text(event.source) or AXUtilities.is_list(event.source):
+        if AXUtilities.is_text(event.source, role) or AXUtilities.is_list(event.source, role):
             combobox = AXObject.find_ancestor(event.source, AXUtilities.is_combo_box)
             if combobox:
-                focus_manager.get_manager().set_locus_of_focus(event, combobox, True)
+                manager.set_locus_of_focus(event, combobox, True)
                 return
 
         # TODO - JD: Is this still needed?
         if self.utilities.flows_from_or_to_selection(event.source):
             return
 
-        if AXUtilities.is_paragraph(event.source):
+        if AXUtilities.is_paragraph(event.source, role):
+            self._last_focused_paragraph = hash(event.source), time.monotonic()
             obj, _offset = self.point_of_reference.get("lastCursorPosition", (None, -1))
             _string, start, end = AXText.get_cached_selected_text(obj)
             if start != end:
                 return
 
-            manager = input_event_manager.get_manager()
-            if manager.last_event_was_left() or manager.last_event_was_right():
-                focus_manager.get_manager().set_locus_of_focus(event, event.source, False)
+            input_manager = input_event_manager.get_manager()
+            if input_manager.last_event_was_left() or input_manager.last_event_was_right():
+                manager.set_locus_of_focus(event, event.source, False)
                 return
 
         if self.utilities.isSpreadSheetTable(event.source):
-            if focus_manager.get_manager().focus_is_dead():
+            if manager.focus_is_dead():
                 msg = "SOFFICE: Event believed to be post-editing focus claim."
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                focus_manager.get_manager().set_locus_of_focus(event, event.source, False)
+                manager.set_locus_of_focus(event, event.source, False)
                 return
 
             if AXUtilities.is_paragraph(focus) or AXUtilities.is_table_cell(focus):
                 if AXObject.find_ancestor(focus, lambda x: x == event.source):
                     msg = "SOFFICE: Event believed to be post-editing focus claim based on role."
                     debug.print_message(debug.LEVEL_INFO, msg, True)
-                    focus_manager.get_manager().set_locus_of_focus(event, event.source, False)
+                    manager.set_locus_of_focus(event, event.source, False)
                     return
 
                 # If we were in a cell, and a different table is claiming focus, it's likely that
@@ -517,9 +514,10 @@ class Script(default.Script):
             return
 
         if self.utilities.isSpreadSheetTable(event.source):
-            if settings_manager.get_manager().get_setting("onlySpeakDisplayedText"):
+            manager = settings_manager.get_manager()
+            if manager.get_setting("onlySpeakDisplayedText"):
                 return
-            if settings_manager.get_manager().get_setting("alwaysSpeakSelectedSpreadsheetRange"):
+            if manager.get_setting("alwaysSpeakSelectedSpreadsheetRange"):
                 self.utilities.speakSelectedCellRange(event.source)
                 return
             if self.utilities.handle_row_and_column_selection_change(event.source):
@@ -528,11 +526,12 @@ class Script(default.Script):
             return
 
         if event.source == self.spellcheck.get_suggestions_list():
-            if focus_manager.get_manager().focus_is_active_window():
+            manager = focus_manager.get_manager()
+            if manager.focus_is_active_window():
                 msg = "SOFFICE: Not presenting because locusOfFocus is window"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
             elif AXUtilities.is_focused(event.source):
-                focus_manager.get_manager().set_locus_of_focus(event, event.any_data, False)
+                manager.set_locus_of_focus(event, event.any_data, False)
                 self.update_braille(event.any_data)
                 self.spellcheck.present_suggestion_list_item()
             else:
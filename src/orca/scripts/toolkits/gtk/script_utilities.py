@@ -31,6 +31,8 @@ from orca import script_utilities
 from orca.ax_object import AXObject
 from orca.ax_utilities import AXUtilities
 
+_RGB_STRING_RE = re.compile(r"rgb|[^\w,]", re.IGNORECASE)
+
 class Utilities(script_utilities.Utilities):
 
     def __init__(self, script):
@@ -87,8 +89,7 @@ class Utilities(script_utilities.Utilities):
             and AXObject.find_ancestor(obj, AXUtilities.is_window) is not None
 
     def rgbFromString(self, attributeValue):
-        regex = re.compile(r"rgb|[^\w,]", re.IGNORECASE)
-        string = re.sub(regex, "", attributeValue)
+        string = _RGB_STRING_RE.sub("", attributeValue)
         red, green, blue = string.split(",")
 
         return int(red) >> 8, int(green) >> 8, int(blue) >> 8
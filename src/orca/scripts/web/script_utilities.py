@@ -2718,7 +2718,7 @@ class Utilities(script_utilities.Utilities):
 
         if rv and not AXObject.get_name(obj) and AXObject.supports_text(obj):
             text = AXText.get_all_text(obj)
-            if not text.replace("\ufffc", ""):
+            if not text.strip("\ufffc"):
                 tokens = ["WEB:", obj, "is not clickable: its text is just EOCs"]
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 rv = False
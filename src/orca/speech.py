@@ -41,16 +41,20 @@ from .acss import ACSS
 _logger = logger.getLogger()
 log = _logger.newLog("speech")
 
+# The types speak() accepts, both as content and as list elements.
+_VALID_SPEAK_TYPES = (str, list, speech_generator.Pause, ACSS)
+
 # The speech server to use for all speech operations.
 #
 _speechserver = None
 
-def _init_speech_server(module_name, speech_server_info):
+# Maps factory module name to the imported module, or None when both import
+# attempts failed, so repeated init calls don't retry dead imports.
+_factory_cache = {}
 
-    global _speechserver
-
-    if not module_name:
-        return
+def _get_speech_server_factory(module_name):
+    if module_name in _factory_cache:
+        return _factory_cache[module_name]
 
     factory = None
     try:
@@ -61,6 +65,20 @@ def _init_speech_server(module_name, speech_server_info):
         except Exception:
             debug.print_exception(debug.LEVEL_SEVERE)
 
+    _factory_cache[module_name] = factory
+    return factory
+
+def _init_speech_server(module_name, speech_server_info):
+
+    global _speechserver
+
+    if not module_name:
+        return
+
+    factory = _get_speech_server_factory(module_name)
+    if factory is None:
+        raise RuntimeError(f"ERROR: No factory module for: {module_name}")
+
     # Now, get the speech server we care about.
     #
     speech_server_info = settings.speechServerInfo
@@ -128,6 +146,10 @@ def check_speech_setting():
 def __resolve_acss(acss=None):
     if isinstance(acss, ACSS):
         family = acss.get(acss.FAMILY)
+        # Resolution mutates the ACSS in place, so an already-resolved family
+        # (common when the same voice is spoken repeatedly) needs no rebuild.
+        if isinstance(family, VoiceFamily):
+            return acss
         try:
             family = VoiceFamily(family)
         except Exception:
@@ -171,8 +193,9 @@ def _speak(text, acss, interrupt):
         debug.print_message(debug.LEVEL_INFO, msg, True)
 
     resolved_voice = __resolve_acss(voice)
-    msg = f"SPEECH OUTPUT: '{text}' {resolved_voice}"
-    debug.print_message(debug.LEVEL_INFO, msg, True)
+    if debug.debugLevel <= debug.LEVEL_INFO:
+        msg = f"SPEECH OUTPUT: '{text}' {resolved_voice}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
     _speechserver.speak(text, resolved_voice, interrupt)
 
 def speak(content, acss=None, interrupt=True):
@@ -183,31 +206,35 @@ def speak(content, acss=None, interrupt=True):
     if settings.silenceSpeech:
         return
 
-    valid_types = (str, list, speech_generator.Pause, ACSS)
+    # Plain strings are the most common content; handle them without the
+    # list-processing scaffolding below.
+    if isinstance(content, str):
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            msg = f"SPEECH: Speak '{content}' acss: {acss}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+        _speak(content, acss, interrupt)
+        return
+
     error = "SPEECH: Bad content sent to speak():"
-    if not isinstance(content, valid_types):
+    if not isinstance(content, _VALID_SPEAK_TYPES):
         debug.print_message(debug.LEVEL_INFO, error + str(content), True, True)
         return
 
-    if isinstance(content, str):
-        msg = f"SPEECH: Speak '{content}' acss: {acss}"
-        debug.print_message(debug.LEVEL_INFO, msg, True)
-    else:
+    if debug.debugLevel <= debug.LEVEL_INFO:
         tokens = ["SPEECH: Speak", content, ", acss:", acss]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-    if isinstance(content, str):
-        _speak(content, acss, interrupt)
     if not isinstance(content, list):
         return
 
     to_speak = []
     active_voice = acss
+    base_voice = None
     if acss is not None:
         active_voice = ACSS(acss)
 
     for element in content:
-        if not isinstance(element, valid_types):
+        if not isinstance(element, _VALID_SPEAK_TYPES):
             debug.print_message(debug.LEVEL_INFO, error + str(element), True, True)
         elif isinstance(element, list):
             speak(element, acss, interrupt)
@@ -215,19 +242,25 @@ def speak(content, acss=None, interrupt=True):
             if len(element):
                 to_speak.append(element)
         elif to_speak:
-            new_voice = ACSS(acss)
             new_items_to_speak = []
             if isinstance(element, speech_generator.Pause):
                 if to_speak[-1] and to_speak[-1][-1].isalnum():
                     to_speak[-1] += '.'
+                # A pause resets the voice to the caller's acss; one copy can
+                # serve every pause since it is never updated in place.
+                if base_voice is None:
+                    base_voice = ACSS(acss)
+                new_voice = base_voice
             elif isinstance(element, ACSS):
+                new_voice = ACSS(acss)
                 new_voice.update(element)
                 if active_voice is None:
                     active_voice = new_voice
                 if new_voice == active_voice:
                     continue
-                tokens = ["SPEECH: New voice", new_voice, " != active voice", active_voice]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                if debug.debugLevel <= debug.LEVEL_INFO:
+                    tokens = ["SPEECH: New voice", new_voice, " != active voice", active_voice]
+                    debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 new_items_to_speak.append(to_speak.pop())
 
             if to_speak: